@@ -15,5 +15,15 @@ class DRFLocalizeConfig(AppConfig):
     name = 'drf_localize'
     verbose_name = "DRFLocalizeConfig"
 
+    def ready(self):
+        from drf_localize.applications.managers import prepare_application_aware_models
+
+        # Compute models application scoping
+        prepare_application_aware_models(models=self.apps.get_models())
+
+        # Connect application & catalog signals
+        from drf_localize.applications import signals as application_signals  # noqa
+        from drf_localize.catalogs import signals as catalog_signals  # noqa
+
 
 default_app_config = 'drf_localize.DRFLocalizeConfig'
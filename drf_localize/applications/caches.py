@@ -0,0 +1,102 @@
+from time import time
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+
+# Import your package here.
+
+from drf_localize.settings import settings
+from drf_localize.core.caches import LocalizeLRUCache
+from drf_localize.models import LocalizeApplication
+
+# Create your caches here.
+
+application_cache = LocalizeLRUCache(
+    maxsize=settings.APPLICATION_CACHE_SIZE,
+    timeout=settings.APPLICATION_CACHE_TIMEOUT
+)
+
+
+# Fields left out of cached rows, deferred & read fresh once accessed.
+# Fallbacks are compiled into catalogs, a stale copy would be cached under a new catalog version
+UNCACHED_FIELDS = ('fallbacks',)
+
+# Shared API key generation prefix
+GENERATION_KEY = 'drf_localize:application'
+
+
+# Create your helper functions here.
+
+def _shared_cache():
+    alias = settings.APPLICATION_CACHE_ALIAS
+    return caches[alias] if alias else None
+
+
+def _generation(key: str = ''):
+    """
+    Get API key generation from shared cache, bumped when its application changes in any process
+    """
+    cache = _shared_cache()
+    return cache.get(f'{GENERATION_KEY}:{key}') if cache else None
+
+
+def _cached(key: str = '', generation=None):
+    # Cached rows of an older generation were changed or deleted by another process
+    if (cached := application_cache.get(key)) is not None and cached[0] == generation:
+        return LocalizeApplication.from_db(*cached[1])
+
+    return None
+
+
+def _snapshot(application) -> tuple:
+    names = [
+        field.attname for field in LocalizeApplication._meta.concrete_fields  # noqa
+        if field.attname not in UNCACHED_FIELDS
+    ]
+    values = [getattr(application, name) for name in names]
+    return application._state.db, names, values  # noqa
+
+
+def get_localize_application(key: str = ''):
+    """
+    Get application by API key, application rows are cached and a fresh instance is returned on every call.
+    With APPLICATION_CACHE_ALIAS, cached rows are checked against the shared API key generation
+    """
+    if not key:
+        return None
+
+    generation = _generation(key=key)
+    if (application := _cached(key=key, generation=generation)) is not None:
+        return application
+
+    application = LocalizeApplication.objects.filter(hash=key).first()
+    if application is not None:
+        application_cache.set(key, (generation, _snapshot(application)))
+
+    return application
+
+
+def invalidate_localize_application(application=None):
+    """
+    Invalidate cached application row, other processes drop theirs through the shared generation if
+    APPLICATION_CACHE_ALIAS is set, or once APPLICATION_CACHE_TIMEOUT passed
+    """
+    if not (key := getattr(application, 'hash', None)):
+        return
+
+    application_cache.delete(key)
+    if cache := _shared_cache():
+        cache.set(f'{GENERATION_KEY}:{key}', int(time() * 1000), timeout=None)
+
+
+async def aget_localize_application(key: str = ''):
+    """
+    Async variant of get_localize_application, only cache misses & shared generation checks are run
+    in a worker thread
+    """
+    if not key:
+        return None
+
+    if not _shared_cache() and (application := _cached(key=key)) is not None:
+        return application
+
+    return await sync_to_async(get_localize_application, thread_sensitive=True)(key=key)
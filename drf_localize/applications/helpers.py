@@ -1,24 +1,25 @@
-try:
-    from threading import local
-except ImportError:
-    from django.utils._threading_local import local  # noqa
+from contextvars import ContextVar
 
-thread_local = local()
+# Context variable is isolated per thread and per asyncio task
+localize_application = ContextVar('localize_application', default=None)
 
 
 # Create your helper functions here.
 
 
-def set_current_localize_application(localize_application):
-    setattr(thread_local, "localize_application", localize_application)
+def set_current_localize_application(application):
+    return localize_application.set(application)
 
 
-def unset_current_localize_application():
-    setattr(thread_local, "localize_application", None)
+def unset_current_localize_application(token=None):
+    if token is not None:
+        return localize_application.reset(token)
+
+    localize_application.set(None)
 
 
 def current_localize_application():
-    return getattr(thread_local, "localize_application", None)
+    return localize_application.get()
 
 
 def current_localize_application_id():
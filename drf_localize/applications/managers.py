@@ -19,6 +19,25 @@ def field_exists(model, field=''):
     return False
 
 
+# Application scoping metadata, computed once per model
+application_aware_models = {}
+
+
+def application_field_exists(model) -> bool:
+    try:
+        return application_aware_models[model]
+    except KeyError:
+        return application_aware_models.setdefault(model, bool(field_exists(model, 'application_id')))
+
+
+def prepare_application_aware_models(models=None):
+    """
+    Compute application scoping metadata for models, called once apps are ready
+    """
+    for model in models or []:
+        application_field_exists(model)
+
+
 # Create your managers here.
 
 class ApplicationUnawareManager(models.Manager):
@@ -38,7 +57,7 @@ class ApplicationAwareManager(models.Manager):
             return self._queryset_class(self.model)
 
         filtering = {}
-        if field_exists(self.model, 'application_id'):  # noqa
+        if application_field_exists(self.model):
             filtering.update({'application_id': application_id})
 
         # If the manager was built from a queryset using
@@ -59,7 +78,7 @@ class ApplicationAwareQuerySet(models.QuerySet):
     def create(self, **kwargs):
         application_id = current_localize_application_id()
 
-        field = field_exists(self.model, 'application_id')
+        field = application_field_exists(self.model)
         if application_id and not (kwargs.get('application_id', None) or kwargs.get('application', None)) and field:
             kwargs.update({'application_id': application_id})
 
@@ -68,7 +87,7 @@ class ApplicationAwareQuerySet(models.QuerySet):
     def update_or_create(self, defaults=None, **kwargs):
         application_id = current_localize_application_id()
 
-        field = field_exists(self.model, 'application_id')
+        field = application_field_exists(self.model)
         if application_id and not (kwargs.get('application_id', None) or kwargs.get('application', None)) and field:
             kwargs.update({'application_id': application_id})
 
@@ -77,22 +96,22 @@ class ApplicationAwareQuerySet(models.QuerySet):
     def get_or_create(self, defaults=None, **kwargs):
         application_id = current_localize_application_id()
 
-        field = field_exists(self.model, 'application_id')
+        field = application_field_exists(self.model)
         if application_id and not (kwargs.get('application_id', None) or kwargs.get('application', None)) and field:
             kwargs.update({'application_id': application_id})
 
         return super().get_or_create(defaults=defaults, **kwargs)
 
-    def bulk_create(self, objs, batch_size=None, ignore_conflicts=False):
+    def bulk_create(self, objs, batch_size=None, ignore_conflicts=False, **kwargs):
         application_id = current_localize_application_id()
 
         objs = list(objs)
-        for obj in objs:
-            field = field_exists(self.model, 'application_id')
-            if field and not (obj.application_id or obj.application):
+        if application_id and application_field_exists(self.model):
+            # Stamp every object without an application in a single pass
+            for obj in [obj for obj in objs if not obj.application_id]:
                 obj.application_id = application_id
 
-        return super().bulk_create(objs, batch_size, ignore_conflicts)
+        return super().bulk_create(objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts, **kwargs)
 
     def as_manager(cls):
         manager = ApplicationAwareManager.from_queryset(cls)()
@@ -1,8 +1,10 @@
+from django.utils.translation import ugettext_lazy as _
 from rest_framework.serializers import (
     ModelSerializer,
     Serializer,
     PrimaryKeyRelatedField
 )
+from rest_framework.exceptions import ValidationError
 
 # Import your package here.
 
@@ -24,9 +26,19 @@ class LocalizeApplicationSerializer(ModelSerializer):
             'id',
             'hash',
             'title',
-            'description'
+            'description',
+            'fallbacks'
         ]
 
+    def validate_fallbacks(self, value):
+        if not isinstance(value, dict) or not all(
+                isinstance(languages, list) and all(isinstance(language, str) for language in languages)
+                for languages in value.values()
+        ):
+            raise ValidationError(_('Expected an object of language -> fallback languages list.'))
+
+        return value
+
 
 class LocalizeApplicationLanguageSerializer(Serializer):
     languages_id = PrimaryKeyRelatedField(
@@ -0,0 +1,21 @@
+from django.db.models.signals import (
+    post_save,
+    post_delete,
+)
+from django.db import transaction
+from django.dispatch import receiver
+
+# Import your package here.
+
+from drf_localize.models import LocalizeApplication
+from drf_localize.applications.caches import invalidate_localize_application
+
+
+# Create your signal receivers here.
+
+@receiver(post_save, sender=LocalizeApplication, dispatch_uid='localize_application_saved')
+@receiver(post_delete, sender=LocalizeApplication, dispatch_uid='localize_application_deleted')
+def localize_application_changed(sender, instance, **kwargs):
+    # Invalidated again once committed, rows read before the change was visible are dropped as well
+    invalidate_localize_application(application=instance)
+    transaction.on_commit(lambda: invalidate_localize_application(application=instance))
@@ -0,0 +1,172 @@
+import gzip
+import hashlib
+from django.utils.http import quote_etag
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Import your package here.
+
+from drf_localize.settings import settings
+from drf_localize.core.caches import LocalizeLRUCache
+from drf_localize.core.renderers import RENDERER_VERSION
+from drf_localize.catalogs.versions import get_catalog_version
+from drf_localize.catalogs.storages import load_artifact
+from drf_localize.catalogs.shared import (
+    get_or_build,
+    get_shared,
+    set_shared,
+    is_building,
+)
+
+# Create your caches here.
+
+artifact_cache = LocalizeLRUCache(maxsize=settings.ARTIFACT_CACHE_SIZE, wait=settings.CATALOG_LOCK_TIMEOUT)
+
+# Artifact key without version -> latest built version
+latest_cache = LocalizeLRUCache(maxsize=settings.ARTIFACT_CACHE_SIZE)
+
+
+# Create your helper functions here.
+
+def artifact_fingerprint() -> str:
+    """
+    Fingerprint of renderer & settings shaping artifact bytes, changed by deploys changing the output
+    """
+    options = (RENDERER_VERSION, settings.JSON_COMPACT, settings.ZIP_COMPRESSION, settings.ZIP_COMPRESSION_LEVEL,
+               sorted(settings.FALLBACKS.items()))
+    return hashlib.sha1(repr(options).encode('utf-8')).hexdigest()[:12]
+
+
+def artifact_key(application=None, platform: str = '', language: str = '', version: int = 0,
+                 encoding: str = '', scope: str = '') -> tuple:
+    return getattr(application, 'id', application), platform, language, version, encoding, scope, artifact_fingerprint()
+
+
+def artifact_etag(application=None, platform: str = '', language: str = '', version: int = 0,
+                  encoding: str = '', scope: str = '') -> str:
+    """
+    Strong ETag of an artifact, content is identical within a catalog version, encoding, scope & fingerprint
+    """
+    key = artifact_key(application=application, platform=platform, language=language, version=version,
+                       encoding=encoding, scope=scope)
+    return quote_etag(hashlib.sha1(repr(key).encode('utf-8')).hexdigest())
+
+
+def get_artifact_encodings() -> list:
+    return [encoding for encoding in settings.ARTIFACT_ENCODINGS if encoding != 'br' or brotli]
+
+
+def get_accepted_encoding(request=None) -> str:
+    """
+    Get preferred artifact encoding accepted by request Accept-Encoding header, blank for identity
+    """
+    accepted = set()
+
+    for item in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        encoding, _, parameters = item.strip().partition(';')
+        if parameters.replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        accepted.add(encoding.strip().lower())
+
+    return next((encoding for encoding in get_artifact_encodings() if encoding in accepted), '')
+
+
+def compress(content: bytes = b'', encoding: str = '') -> bytes:
+    if encoding == 'br':
+        return brotli.compress(content)
+
+    if encoding == 'gzip':
+        return gzip.compress(content, mtime=0)
+
+    return content
+
+
+def get_artifact(builder, application=None, platform: str = '', language: str = '', version: int = None,
+                 encoding: str = '', scope: str = '') -> tuple:
+    """
+    Get (filename, content) artifact for the current catalog version, building it only once per version,
+    from process cache, then shared cache, then artifact storage prebuilt by `localize_build` command.
+    Encoded artifacts are compressed once from the identity artifact, scoped artifacts are never prebuilt.
+    """
+    if version is None:
+        version = get_catalog_version(application=application)
+
+    if encoding:
+        key = artifact_key(application=application, platform=platform, language=language, version=version,
+                           encoding=encoding, scope=scope)
+
+        def encode():
+            filename, content = get_artifact(builder, application=application, platform=platform, language=language,
+                                             version=version, scope=scope)
+            return filename, compress(content=content, encoding=encoding)
+
+        return artifact_cache.get_or_set(key, lambda: get_or_build(name='artifact', key=key, builder=encode))
+
+    key = artifact_key(application=application, platform=platform, language=language, version=version, scope=scope)
+
+    def load():
+        if scope:
+            return builder()
+
+        artifact = load_artifact(application=application, version=version, platform=platform, language=language,
+                                 fingerprint=key[-1])
+        return artifact or builder()
+
+    return artifact_cache.get_or_set(key, lambda: get_or_build(name='artifact', key=key, builder=load))
+
+
+def _unversioned(key: tuple = ()) -> tuple:
+    return key[:3] + key[4:]
+
+
+def _versioned(key: tuple = (), version: int = 0) -> tuple:
+    return key[:3] + (version,) + key[4:]
+
+
+def get_stale_artifact(key: tuple = ()):
+    """
+    Get (version, filename, content) of the latest artifact built before the key version, None if unknown
+    """
+    latest = _unversioned(key)
+    version = latest_cache.get(latest) or get_shared(name='artifact-latest', key=latest)
+
+    if not version or version >= key[3]:
+        return None
+
+    stale = _versioned(key, version=version)
+    if not (artifact := artifact_cache.get(stale) or get_shared(name='artifact', key=stale)):
+        return None
+
+    return (version, *artifact)
+
+
+def serve_artifact(builder, application=None, platform: str = '', language: str = '', version: int = None,
+                   encoding: str = '', scope: str = '') -> tuple:
+    """
+    Get (version, filename, content) artifact, while another thread or process builds it
+    the latest older artifact is served instead of waiting, if STALE_WHILE_REVALIDATE is set
+    """
+    if version is None:
+        version = get_catalog_version(application=application)
+
+    key = artifact_key(application=application, platform=platform, language=language, version=version,
+                       encoding=encoding, scope=scope)
+
+    if settings.STALE_WHILE_REVALIDATE and key not in artifact_cache and (
+            artifact_cache.pending(key) or is_building(name='artifact', key=key)
+    ):
+        if stale := get_stale_artifact(key):
+            return stale
+
+    filename, content = get_artifact(builder, application=application, platform=platform, language=language,
+                                     version=version, encoding=encoding, scope=scope)
+
+    # Remember latest built version, served while the next version is built
+    if (latest_cache.get(_unversioned(key)) or 0) < version:
+        latest_cache.set(_unversioned(key), version)
+        set_shared(name='artifact-latest', key=_unversioned(key), value=version)
+
+    return version, filename, content
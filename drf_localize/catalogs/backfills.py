@@ -0,0 +1,24 @@
+from django.apps import apps
+
+# Import your package here.
+
+from drf_localize.core import localize
+
+
+# Create your helper functions here.
+
+def get_backfill_models() -> list:
+    """
+    Get models with LOCALIZE_TRANSLATE, LOCALIZE_FIELD and LOCALIZE_AUTO_UPDATE set
+    """
+    return [model for model in apps.get_models() if all(localize._model_set(model=model))]  # noqa
+
+
+def backfill_models(models: list = None, **kwargs) -> dict:
+    """
+    Backfill translations of every LOCALIZE_AUTO_UPDATE model, returns updated rows by model label
+    """
+    if models is None:
+        models = get_backfill_models()
+
+    return {model._meta.label: localize.backfill(model=model, **kwargs) for model in models}  # noqa
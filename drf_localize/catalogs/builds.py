@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+# Import your package here.
+
+from drf_localize.core import (
+    Localize,
+    localize_platform,
+)
+from drf_localize.applications.helpers import (
+    set_current_localize_application,
+    unset_current_localize_application,
+)
+from drf_localize.catalogs.versions import get_catalog_version
+from drf_localize.catalogs.storages import save_manifest
+from drf_localize.catalogs.artifacts import artifact_fingerprint
+
+
+# Create your helper functions here.
+
+def load_keys(application=None) -> tuple:
+    """
+    Load application keys for its current catalog version, returns (version, Localize instance, languages)
+    """
+    token = set_current_localize_application(application)
+
+    try:
+        request = SimpleNamespace(application=application)
+        version = get_catalog_version(application=application)
+        instance = Localize().get_keys(request=request)
+        return version, instance, instance.get_languages(request=request, cached=False)
+    finally:
+        unset_current_localize_application(token)
+
+
+def compile_application(application=None) -> tuple:
+    """
+    Compile application catalog, returns (version, language -> {key -> value})
+    """
+    version, instance, languages = load_keys(application=application)
+    return version, instance.compile(languages=languages)
+
+
+def build_application(application=None, executor=None) -> tuple:
+    """
+    Render every platform file & zip of an application catalog and save them to the artifact storage,
+    files are rendered with executor.map if set
+    """
+    version, table = compile_application(application=application)
+    tasks = [
+        (platform, language, mapping)
+        for language, mapping in table.items()
+        for platform in localize_platform.PLATFORM_TYPES
+    ]
+
+    artifacts = {}
+    files = {platform: {} for platform in localize_platform.PLATFORM_TYPES}
+    mapper = executor.map if executor else map
+
+    for platform, language, content in (mapper(Localize.render_file, *zip(*tasks)) if tasks else []):
+        extension = localize_platform.PLATFORM_EXTENSIONS[platform]
+        artifacts[(platform, language)] = (f'keys.{extension}', content)
+        files[platform][localize_platform.PLATFORM_FILES[platform].format(language=language)] = content
+
+    # Platform zips & every platform zip
+    for platform in localize_platform.PLATFORM_TYPES:
+        artifacts[(platform, '')] = Localize.make_bundle(files={platform: files[platform]}, platform=platform)
+    artifacts[('', '')] = Localize.make_bundle(files=files)
+
+    save_manifest(application=application, version=version, artifacts=artifacts, fingerprint=artifact_fingerprint())
+    return version, artifacts
@@ -0,0 +1,116 @@
+from django.db import transaction
+
+# Import your package here.
+
+from drf_localize.settings import settings
+from drf_localize.core import localize_key_type
+from drf_localize.models import (
+    LocalizeVersion,
+    LocalizeKeyChange,
+)
+from drf_localize.catalogs.versions import (
+    get_catalog_version,
+    bump_catalog_version,
+    bump_catalog_versions,
+)
+from drf_localize.catalogs.lookups import get_catalog
+
+
+# Create your helper functions here.
+
+def record_change(application_id=None, code: str = '', typing: str = '', action: str = '', previous=None,
+                  versions: tuple = (0, 0)):
+    version, catalog_version = versions
+    return LocalizeKeyChange.objects.create(
+        application_id=application_id,
+        code=code,
+        type=typing,
+        action=action,
+        previous=previous,
+        version=version,
+        catalog_version=catalog_version,
+    )
+
+
+def reset_catalog_version(application=None) -> tuple:
+    """
+    Bump application catalog version of a change without key changes, e.g. languages or fallbacks.
+    A reset is recorded, so delta clients reload the whole catalog
+    """
+    with transaction.atomic():
+        versions = bump_catalog_version(application=application)
+        record_change(application_id=getattr(application, 'id', application), action=LocalizeKeyChange.ACTION_RESET,
+                      versions=versions)
+
+    return versions
+
+
+def reset_catalog_versions():
+    """
+    Bump every known catalog version & record their resets
+    """
+    with transaction.atomic():
+        bump_catalog_versions()
+        catalog_version = get_catalog_version()
+
+        LocalizeKeyChange.objects.bulk_create([
+            LocalizeKeyChange(
+                application_id=application_id,
+                action=LocalizeKeyChange.ACTION_RESET,
+                version=version,
+                catalog_version=catalog_version,
+            )
+            for application_id, version in LocalizeVersion.objects.values_list('application_id', 'version')
+        ])
+
+
+def get_changes(application=None, version: int = 0, languages: list = None) -> dict:
+    """
+    Get exported keys changed & removed per language since a catalog version, as served by the current catalog.
+    Response is `full` if the catalog was reset since, the whole catalog is to be reloaded
+    """
+    current = get_catalog_version(application=application)
+    response = {
+        'version': current,
+        'full': False,
+        'languages': {language: {'changed': {}, 'removed': []} for language in languages},
+    }
+
+    if version >= current:
+        return response
+
+    changes = LocalizeKeyChange.objects.order_by('id')
+    if application_id := getattr(application, 'id', None):
+        changes = changes.filter(application_id=application_id, version__gt=version)
+    else:
+        changes = changes.filter(catalog_version__gt=version)
+
+    if changes.filter(action=LocalizeKeyChange.ACTION_RESET).exists():
+        return {'version': current, 'full': True}
+
+    # Exported names touched since the version, namespace keys export every name they held or hold
+    catalog = get_catalog(application=application, version=current)
+    names = set()
+
+    for code, typing, i18n in changes.values_list('code', 'type', 'previous').iterator(
+            chunk_size=settings.KEY_CHUNK_SIZE):
+        if typing != localize_key_type.KEY_NAMESPACE:
+            names.add(code)
+            continue
+
+        names.update(catalog.namespaces.get(code, {}))
+        for keyed in (i18n.values() if isinstance(i18n, dict) else []):
+            names.update(keyed if isinstance(keyed, dict) else [])
+
+    # Current values are read from the compiled catalog, so plain & namespace key overrides and
+    # fallbacks resolve exactly as in a full download
+    for language in languages:
+        delta = response['languages'][language]
+
+        for name in sorted(names):
+            if (value := catalog.get(key=name, language=language)) is None:
+                delta['removed'].append(name)
+            else:
+                delta['changed'][name] = value
+
+    return response
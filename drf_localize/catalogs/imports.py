@@ -0,0 +1,198 @@
+import xml.etree.ElementTree as et
+from zipfile import BadZipFile
+from django.db import transaction
+from django.utils.translation import ugettext_lazy as _
+from rest_framework.exceptions import ValidationError
+
+# Import your package here.
+
+from drf_localize.settings import settings
+from drf_localize.core import localize_key_type
+from drf_localize.core.readers import (
+    read_platform,
+    read_zip,
+)
+from drf_localize.models import LocalizeKeyChange
+from drf_localize.applications.managers import application_field_exists
+from drf_localize.catalogs.versions import (
+    get_catalog_version,
+    bump_catalog_version,
+)
+
+
+# Create your helper functions here.
+
+def _clean_i18n(i18n=None, typing: str = '', languages: list = None) -> dict:
+    """
+    Keep string values of known languages, namespace languages hold {key -> value} objects
+    """
+    cleaned = {}
+
+    for language in languages:
+        if language not in i18n:
+            continue
+
+        value = i18n[language]
+        if typing == localize_key_type.KEY_NAMESPACE:
+            value = value if isinstance(value, dict) else {}
+            value = {key: item for key, item in value.items() if isinstance(item, str)}
+        elif not isinstance(value, str):
+            value = ''
+
+        cleaned[language] = value
+
+    return cleaned
+
+
+def clean_keys(items=None, languages: list = None) -> dict:
+    """
+    Validate key items against preloaded languages, returns (code, type) -> i18n
+    """
+    keys, errors = {}, {}
+    known = set(languages)
+    max_length = settings.KEY_MODEL_CLASS._meta.get_field('code').max_length  # noqa
+
+    if not isinstance(items, list):
+        raise ValidationError({'non_field_errors': [_('Expected a list of keys.')]})
+
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors[index] = {'non_field_errors': [_('Expected a key object.')]}
+            continue
+
+        code = item.get('code')
+        typing = item.get('type') or localize_key_type.KEY_PLAIN
+        i18n = item.get('i18n') or {}
+
+        if not isinstance(code, str) or not code.strip() or len(code) > max_length:
+            errors[index] = {'code': [_('Valid code of at most %(length)s characters is required.') % {
+                'length': max_length
+            }]}
+        elif typing not in localize_key_type.KEY_TYPES:
+            errors[index] = {'type': [_('"%(type)s" is not a valid choice.') % {'type': typing}]}
+        elif not isinstance(i18n, dict):
+            errors[index] = {'i18n': [_('Expected an object of language keys.')]}
+        elif difference := sorted(set(i18n) - known):
+            errors[index] = {'i18n': [_('Unknown language keys "%(key)s".') % {'key': ','.join(difference)}]}
+        elif (code, typing) in keys:
+            errors[index] = {'code': [_('Duplicate code.')]}
+        else:
+            keys[(code, typing)] = _clean_i18n(i18n=i18n, typing=typing, languages=languages)
+
+    if errors:
+        raise ValidationError(errors)
+
+    return keys
+
+
+def upsert_keys(items=None, application=None, languages: list = None, batch_size: int = None) -> dict:
+    """
+    Create or update keys in a single transaction, given languages override stored ones.
+    Catalog version is bumped once for the whole import. Only keys of the application are upserted,
+    application-less keys without application
+    """
+    batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+    keys = clean_keys(items=items, languages=languages)
+    model = settings.KEY_MODEL_CLASS
+    application_id = getattr(application, 'id', None)
+    scoped = application_field_exists(model)
+    queryset = model.objects.filter(application_id=application_id) if scoped else model.objects.all()
+    codes = list({code for code, typing in keys})
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+    created, updated, changes = [], [], []
+
+    with transaction.atomic():
+        # Existing keys are fetched in chunks of codes, scoped to the application
+        existing = {}
+        for index in range(0, len(codes), settings.KEY_CHUNK_SIZE):
+            chunk = queryset.filter(code__in=codes[index:index + settings.KEY_CHUNK_SIZE])
+
+            for instance in chunk.only('id', 'code', 'type', 'i18n'):
+                existing[(instance.code, instance.type)] = instance
+
+        for (code, typing), i18n in keys.items():
+            if not (instance := existing.get((code, typing))):
+                # New keys carry every language, like single key creation
+                namespaced = typing == localize_key_type.KEY_NAMESPACE
+                i18n = {language: i18n.get(language, {} if namespaced else '') for language in languages}
+                instance = model(code=code, type=typing, i18n=i18n)
+                if scoped:
+                    instance.application_id = application_id
+
+                created.append(instance)
+                changes.append((code, typing, None))
+                continue
+
+            previous = instance.i18n if isinstance(instance.i18n, dict) else {}
+            if {**previous, **i18n} == previous:
+                counts['unchanged'] += 1
+                continue
+
+            instance.i18n = {**previous, **i18n}
+            updated.append(instance)
+            changes.append((code, typing, previous))
+
+        model.objects.bulk_create(created, batch_size=batch_size)
+        model.objects.bulk_update(updated, ['i18n'], batch_size=batch_size)
+
+        counts.update(created=len(created), updated=len(updated))
+
+        if not changes:
+            return {**counts, 'version': get_catalog_version(application=application)}
+
+        # Every upserted key belongs to the application, so only its version is bumped
+        version, catalog_version = bump_catalog_version(application=application_id)
+        LocalizeKeyChange.objects.bulk_create([
+            LocalizeKeyChange(
+                application_id=application_id,
+                code=code,
+                type=typing,
+                action=LocalizeKeyChange.ACTION_SAVE,
+                previous=previous,
+                version=version,
+                catalog_version=catalog_version,
+            )
+            for code, typing, previous in changes
+        ], batch_size=batch_size)
+
+    return {**counts, 'version': version}
+
+
+def collect_keys(rows=None, languages: list = None) -> list:
+    """
+    Collect (language, code, type, value) rows of platform files into key items
+    """
+    items, unknown = {}, set()
+
+    try:
+        for language, code, typing, value in rows:
+            if language not in languages:
+                unknown.add(language)
+                continue
+
+            item = items.setdefault((code, typing), {'code': code, 'type': typing, 'i18n': {}})
+            item['i18n'][language] = value
+    except (et.ParseError, BadZipFile, UnicodeDecodeError, ValueError) as e:
+        raise ValidationError({'file': [_('Unreadable file - %(error)s') % {'error': e}]})
+
+    if unknown:
+        raise ValidationError({'file': [_('Unknown language keys "%(key)s".') % {'key': ','.join(sorted(unknown))}]})
+
+    return list(items.values())
+
+
+def import_file(stream=None, platform: str = '', language: str = '', application=None, languages: list = None) -> dict:
+    """
+    Upsert keys of a single language platform file
+    """
+    rows = ((language, code, typing, value) for code, typing, value in read_platform(platform=platform, stream=stream))
+    items = collect_keys(rows=rows, languages=languages)
+    return upsert_keys(items=items, application=application, languages=languages)
+
+
+def import_zip(stream=None, application=None, languages: list = None) -> dict:
+    """
+    Upsert keys of every language & platform file of a zip in `build_zip` layout
+    """
+    items = collect_keys(rows=read_zip(stream=stream), languages=languages)
+    return upsert_keys(items=items, application=application, languages=languages)
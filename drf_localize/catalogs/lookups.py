@@ -0,0 +1,67 @@
+from time import monotonic
+from django.utils.translation import get_language
+
+# Import your package here.
+
+from drf_localize.settings import settings
+from drf_localize.core.caches import LocalizeLRUCache
+from drf_localize.core.catalog import LocalizeCatalog
+from drf_localize.applications.helpers import current_localize_application
+from drf_localize.catalogs.versions import get_catalog_version
+from drf_localize.catalogs.shared import get_or_build
+from drf_localize.catalogs.builds import load_keys
+from drf_localize.catalogs.artifacts import artifact_fingerprint
+
+# Create your caches here.
+
+# Application id -> (catalog, last version check)
+catalog_cache = LocalizeLRUCache(maxsize=settings.CATALOG_CACHE_SIZE)
+
+
+# Create your helper functions here.
+
+def load_catalog(application=None) -> LocalizeCatalog:
+    """
+    Load application catalog from database into a compact catalog, fallbacks resolved
+    """
+    version, instance, languages = load_keys(application=application)
+    return instance.to_catalog(languages=languages, version=version)
+
+
+def get_catalog(application=None, version: int = None) -> LocalizeCatalog:
+    """
+    Get application compact catalog from process cache, then shared cache, then database, reloaded only
+    when its version changed. Without version, catalog version is checked at most once per LOOKUP_CHECK_INTERVAL seconds
+    """
+    application_id = getattr(application, 'id', None)
+    catalog, checked = catalog_cache.get(application_id, (None, 0))
+
+    if version is None:
+        if catalog is not None and monotonic() - checked < settings.LOOKUP_CHECK_INTERVAL:
+            return catalog
+
+        version = get_catalog_version(application=application)
+
+    # Shared catalogs are keyed by fingerprint too, compiled with settings like FALLBACKS of another deploy
+    if catalog is None or catalog.version != version:
+        catalog = get_or_build(name='catalog', key=(application_id, version, artifact_fingerprint()),
+                               builder=lambda: load_catalog(application=application))
+
+    catalog_cache.set(application_id, (catalog, monotonic()))
+    return catalog
+
+
+def t(key: str = '', language: str = None, namespace: str = None, application=None, default: str = None) -> str:
+    """
+    Translate key of a namespace, or as exported without namespace, for the active language & current application.
+    Key itself is returned if it's not translated, like gettext
+    """
+    catalog = get_catalog(application=application or current_localize_application())
+    language = (language or get_language() or '').lower()
+
+    # Regional language falls back to its base language, e.g. en-us -> en
+    for code in dict.fromkeys([language, language.split('-')[0]]):
+        if (value := catalog.get(key=key, language=code, namespace=namespace)) is not None:
+            return value
+
+    return key if default is None else default
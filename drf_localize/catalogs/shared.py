@@ -0,0 +1,79 @@
+import hashlib
+from time import (
+    monotonic,
+    sleep,
+)
+from django.core.cache import caches
+
+# Import your package here.
+
+from drf_localize.settings import settings
+
+# Create your constants here.
+
+POLL_INTERVAL = 0.05
+
+
+# Create your helper functions here.
+
+def get_shared_cache():
+    alias = settings.CATALOG_CACHE_ALIAS
+    return caches[alias] if alias else None
+
+
+def shared_key(name: str = '', key=None) -> str:
+    # Keys hold catalog versions, so stale entries are never read and simply expire
+    return f'drf_localize:{name}:{hashlib.sha1(repr(key).encode("utf-8")).hexdigest()}'
+
+
+def get_shared(name: str = '', key=None):
+    cache = get_shared_cache()
+    return cache.get(shared_key(name=name, key=key)) if cache else None
+
+
+def set_shared(name: str = '', key=None, value=None):
+    if cache := get_shared_cache():
+        cache.set(shared_key(name=name, key=key), value, timeout=settings.CATALOG_CACHE_TIMEOUT)
+
+
+def is_building(name: str = '', key=None) -> bool:
+    """
+    Check whether another process holds the build lock of a shared value
+    """
+    cache = get_shared_cache()
+    return bool(cache and cache.get(f'{shared_key(name=name, key=key)}:lock'))
+
+
+def get_or_build(name: str = '', key=None, builder=None):
+    """
+    Get value from the shared cache, built by a single process at once, others wait for it up to
+    CATALOG_LOCK_TIMEOUT seconds and build it themselves afterwards. Built directly without shared cache
+    """
+    if not (cache := get_shared_cache()):
+        return builder()
+
+    key = shared_key(name=name, key=key)
+    if (value := cache.get(key)) is not None:
+        return value
+
+    lock = f'{key}:lock'
+    deadline = monotonic() + settings.CATALOG_LOCK_TIMEOUT
+
+    while not cache.add(lock, 1, timeout=settings.CATALOG_LOCK_TIMEOUT):
+        if monotonic() >= deadline:
+            return builder()
+
+        sleep(POLL_INTERVAL)
+        if (value := cache.get(key)) is not None:
+            return value
+
+    try:
+        # Built by the previous lock holder
+        if (value := cache.get(key)) is not None:
+            return value
+
+        value = builder()
+        cache.set(key, value, timeout=settings.CATALOG_CACHE_TIMEOUT)
+        return value
+    finally:
+        cache.delete(lock)
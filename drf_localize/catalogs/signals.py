@@ -0,0 +1,178 @@
+from functools import partial
+from contextvars import ContextVar
+from django.db.models.signals import (
+    pre_save,
+    post_save,
+    pre_delete,
+    post_delete,
+    m2m_changed,
+)
+from django.db import transaction
+from django.dispatch import receiver
+
+# Import your package here.
+
+from drf_localize.settings import settings
+from drf_localize.models import (
+    LocalizeApplication,
+    LocalizeVersion,
+    LocalizeKeyChange,
+)
+from drf_localize.core.languages import invalidate_languages
+from drf_localize.catalogs.backfills import backfill_models
+from drf_localize.catalogs.changes import (
+    record_change,
+    reset_catalog_version,
+    reset_catalog_versions,
+)
+from drf_localize.catalogs.versions import bump_catalog_version
+
+# Create your context variables here.
+
+# Ids of applications being deleted, their keys are removed by the cascade
+deleting_applications = ContextVar('deleting_applications', default=frozenset())
+
+
+# Create your helper functions here.
+
+def _on_commit_once(func):
+    # Queued callbacks are dropped on rollback, so a callback is queued at most once per transaction
+    if not any(queued[1] is func for queued in transaction.get_connection().run_on_commit):
+        transaction.on_commit(func)
+
+
+def _is_deleting(application_id=None, origin=None) -> bool:
+    # Django >= 4.1 sends the deletion origin, older versions rely on application pre_delete
+    if isinstance(origin, LocalizeApplication):
+        return True
+
+    return application_id in deleting_applications.get()
+
+
+# Create your signal receivers here.
+
+@receiver(pre_save, sender=settings.KEY_MODEL_CLASS, dispatch_uid='localize_key_saving')
+def localize_key_saving(sender, instance, raw=False, **kwargs):
+    # Keep translations before the change for the change log
+    instance._localize_previous = None
+
+    if instance.pk and not raw:
+        instance._localize_previous = sender._base_manager.filter(pk=instance.pk).values_list(  # noqa
+            'code', 'type', 'i18n'
+        ).first()
+
+
+@receiver(post_save, sender=settings.KEY_MODEL_CLASS, dispatch_uid='localize_key_saved')
+def localize_key_saved(sender, instance, raw=False, **kwargs):
+    # Fixtures are loaded as is
+    if raw:
+        return
+
+    application_id = getattr(instance, 'application_id', None)
+    code, typing, previous = getattr(instance, '_localize_previous', None) or (instance.code, instance.type, None)
+
+    # Version & its change log are committed together, delta readers never see one without the other
+    with transaction.atomic():
+        versions = bump_catalog_version(application=application_id)
+
+        # Renamed key, previous key is removed
+        if (code, typing) != (instance.code, instance.type):
+            record_change(application_id=application_id, code=code, typing=typing,
+                          action=LocalizeKeyChange.ACTION_DELETE, previous=previous, versions=versions)
+            previous = None
+
+        record_change(application_id=application_id, code=instance.code, typing=instance.type,
+                      action=LocalizeKeyChange.ACTION_SAVE, previous=previous, versions=versions)
+
+
+@receiver(post_delete, sender=settings.KEY_MODEL_CLASS, dispatch_uid='localize_key_deleted')
+def localize_key_deleted(sender, instance, origin=None, **kwargs):
+    application_id = getattr(instance, 'application_id', None)
+
+    # Keys removed along with their application have no catalog left
+    if _is_deleting(application_id=application_id, origin=origin):
+        return
+
+    with transaction.atomic():
+        # Versions are never created on delete, a missing version has nothing cached to invalidate
+        if (versions := bump_catalog_version(application=application_id, create=False)) is None:
+            return
+
+        record_change(application_id=application_id, code=instance.code, typing=instance.type,
+                      action=LocalizeKeyChange.ACTION_DELETE, previous=instance.i18n, versions=versions)
+
+
+@receiver(pre_save, sender=settings.LANGUAGE_MODEL_CLASS, dispatch_uid='localize_language_saving')
+def localize_language_saving(sender, instance, raw=False, **kwargs):
+    # Keep language code before the change, other field changes leave the language set as is
+    instance._localize_previous = None
+
+    if instance.pk and not raw:
+        field = settings.LANGUAGE_MODEL_CLASS_FIELD
+        instance._localize_previous = sender._base_manager.filter(pk=instance.pk).values_list(  # noqa
+            field, flat=True
+        ).first()
+
+
+@receiver(post_save, sender=settings.LANGUAGE_MODEL_CLASS, dispatch_uid='localize_language_saved')
+@receiver(post_delete, sender=settings.LANGUAGE_MODEL_CLASS, dispatch_uid='localize_language_deleted')
+def localize_language_changed(sender, instance, created=True, raw=False, **kwargs):
+    # Fixtures are loaded as is, run `localize_backfill` once loaded
+    if raw:
+        return
+
+    # Saved language without a code change, language set is the same
+    code = getattr(instance, settings.LANGUAGE_MODEL_CLASS_FIELD)
+    if not created and getattr(instance, '_localize_previous', None) == code:
+        return
+
+    _on_commit_once(invalidate_languages)
+    reset_catalog_versions()
+
+    # Language set changed, backfill model translations once committed
+    _on_commit_once(backfill_models)
+
+
+@receiver(post_save, sender=LocalizeApplication, dispatch_uid='localize_application_catalog_saved')
+def localize_application_catalog_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    # Fallbacks may have changed, resolved catalogs are rebuilt
+    if not created:
+        reset_catalog_version(application=instance)
+        return
+
+    # Version is created upfront, so key deletions always have a version to bump
+    LocalizeVersion.objects.get_or_create(application=instance)
+
+
+@receiver(pre_delete, sender=LocalizeApplication, dispatch_uid='localize_application_deleting')
+def localize_application_deleting(sender, instance, **kwargs):
+    deleting_applications.set(deleting_applications.get() | {instance.pk})
+
+
+@receiver(post_delete, sender=LocalizeApplication, dispatch_uid='localize_application_catalog_deleted')
+def localize_application_catalog_deleted(sender, instance, **kwargs):
+    deleting_applications.set(deleting_applications.get() - {instance.pk})
+
+
+@receiver(m2m_changed, sender=LocalizeApplication.languages.through, dispatch_uid='localize_application_languages')
+def localize_application_languages_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    # Language side of the relation, every affected application is bumped
+    if reverse:
+        # Cleared relations do not carry affected applications
+        if pk_set is None:
+            transaction.on_commit(invalidate_languages)
+            reset_catalog_versions()
+
+        for application_id in pk_set or []:
+            transaction.on_commit(partial(invalidate_languages, application=application_id))
+            reset_catalog_version(application=application_id)
+        return
+
+    transaction.on_commit(partial(invalidate_languages, application=instance.pk))
+    reset_catalog_version(application=instance)
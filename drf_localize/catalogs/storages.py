@@ -0,0 +1,87 @@
+import os
+import json
+import hashlib
+from django.core.files.base import ContentFile
+
+# Import your package here.
+
+from drf_localize.settings import settings
+
+
+# Create your helper functions here.
+
+def get_artifact_storage():
+    """
+    Get configured artifact storage, prebuilt artifacts are disabled without ARTIFACT_STORAGE_CLASS
+    """
+    storage = settings.ARTIFACT_STORAGE_CLASS
+    return storage() if storage else None
+
+
+def manifest_name(application=None, version: int = 0) -> str:
+    application = getattr(application, 'hash', None) or 'default'
+    return f'{settings.ARTIFACT_STORAGE_PATH}/{application}/{version}.json'
+
+
+def artifact_name(platform: str = '', language: str = '') -> str:
+    return f'{platform}/{language}'
+
+
+def save_blob(storage, filename: str = '', content: bytes = b'') -> str:
+    """
+    Save content addressed blob, identical content is stored once
+    """
+    digest = hashlib.sha256(content).hexdigest()
+    extension = os.path.splitext(filename)[1]
+    name = f'{settings.ARTIFACT_STORAGE_PATH}/objects/{digest[:2]}/{digest}{extension}'
+
+    if not storage.exists(name):
+        storage.save(name, ContentFile(content))
+
+    return name
+
+
+def save_manifest(application=None, version: int = 0, artifacts: dict = None, fingerprint: str = '') -> str:
+    """
+    Save {(platform, language) -> (filename, content)} artifacts of an application catalog version
+    """
+    storage = get_artifact_storage()
+    manifest = {'version': version, 'fingerprint': fingerprint, 'artifacts': {}}
+
+    for (platform, language), (filename, content) in (artifacts or {}).items():
+        manifest['artifacts'][artifact_name(platform=platform, language=language)] = {
+            'filename': filename,
+            'path': save_blob(storage, filename=filename, content=content),
+        }
+
+    name = manifest_name(application=application, version=version)
+    if storage.exists(name):
+        storage.delete(name)
+
+    return storage.save(name, ContentFile(json.dumps(manifest).encode('utf-8')))
+
+
+def load_artifact(application=None, version: int = 0, platform: str = '', language: str = '', fingerprint: str = ''):
+    """
+    Load prebuilt (filename, content) artifact, None if it was not built for this catalog version & fingerprint
+    """
+    if not (storage := get_artifact_storage()):
+        return None
+
+    name = manifest_name(application=application, version=version)
+    if not storage.exists(name):
+        return None
+
+    try:
+        with storage.open(name) as f:
+            manifest = json.load(f)
+
+        # Built by a renderer or settings producing other bytes
+        if manifest.get('fingerprint', '') != fingerprint:
+            return None
+
+        artifact = manifest['artifacts'][artifact_name(platform=platform, language=language)]
+        with storage.open(artifact['path']) as f:
+            return artifact['filename'], f.read()
+    except (OSError, KeyError, ValueError):
+        return None
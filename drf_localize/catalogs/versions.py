@@ -0,0 +1,77 @@
+from django.db.models import F
+from django.utils import timezone
+
+# Import your package here.
+
+from drf_localize.models import LocalizeVersion
+
+
+# Create your helper functions here.
+
+def _application_id(application=None):
+    return getattr(application, 'id', application) or None
+
+
+def _lookup(application_id=None) -> dict:
+    # Whole catalog row is the unique `whole` one
+    return {'application_id': application_id} if application_id else {'whole': True}
+
+
+def get_catalog_state(application=None) -> tuple:
+    """
+    Get application catalog (version, modified), without application the whole catalog state is returned
+    """
+    state = LocalizeVersion.objects.filter(
+        **_lookup(application_id=_application_id(application))
+    ).values_list('version', 'modified').first()
+
+    return state or (0, None)
+
+
+def get_catalog_version(application=None) -> int:
+    """
+    Get application catalog version, without application the whole catalog version is returned
+    """
+    version, _ = get_catalog_state(application=application)
+    return version
+
+
+def _bump(application_id=None, create: bool = True):
+    queryset = LocalizeVersion.objects.filter(**_lookup(application_id=application_id))
+    updated = queryset.update(
+        version=F('version') + 1,
+        modified=timezone.now(),
+    )
+
+    if not updated:
+        if not create:
+            return None
+
+        instance, _ = LocalizeVersion.objects.get_or_create(**_lookup(application_id=application_id),
+                                                            defaults={'version': 1})
+        return instance.version
+
+    return queryset.values_list('version', flat=True).first()
+
+
+def bump_catalog_version(application=None, create: bool = True):
+    """
+    Bump application catalog version, the whole catalog version is bumped as well.
+    Returns (application version, whole catalog version). Without create, only existing versions are bumped
+    and None is returned if there is none
+    """
+    version = _bump(create=create)
+
+    if application_id := _application_id(application):
+        application_version = _bump(application_id=application_id, create=create)
+        return None if None in (application_version, version) else (application_version, version)
+
+    return None if version is None else (version, version)
+
+
+def bump_catalog_versions():
+    """
+    Bump every known catalog version, used when languages are changed
+    """
+    LocalizeVersion.objects.update(version=F('version') + 1, modified=timezone.now())
+    LocalizeVersion.objects.get_or_create(**_lookup(), defaults={'version': 1})
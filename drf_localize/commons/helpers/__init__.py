@@ -16,3 +16,27 @@ def upsert_file(path):
     # Ignore exception if setting a file without a directory
     with suppress(FileNotFoundError):
         os.makedirs(os.path.dirname(path), exist_ok=True)
+
+
+def write_file(path, content: bytes = b''):
+    """
+    Write file content, creating sub-folders and folders by path
+    """
+    upsert_file(path)
+
+    with open(path, 'wb') as f:
+        f.write(content)
+
+    return path
+
+
+def stream_file(path, render=None):
+    """
+    Stream rendered content into a file, creating sub-folders and folders by path
+    """
+    upsert_file(path)
+
+    with open(path, 'wb') as f:
+        render(f)
+
+    return path
@@ -0,0 +1,30 @@
+import json
+from django.conf import settings as django_settings
+from django.utils.translation import ugettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+# Create your parsers here.
+
+class NDJSONParser(BaseParser):
+    """
+    Newline delimited JSON parser, lines are read from the request stream one by one
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', django_settings.DEFAULT_CHARSET)
+        items = []
+
+        for number, line in enumerate(stream or [], start=1):
+            if not (line := line.strip()):
+                continue
+
+            try:
+                items.append(json.loads(line.decode(encoding)))
+            except ValueError as e:
+                raise ParseError(_('NDJSON parse error on line %(line)s - %(error)s') % {'line': number, 'error': e})
+
+        return items
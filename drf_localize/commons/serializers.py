@@ -1,9 +1,12 @@
 from django.db import IntegrityError
 from django.utils.translation import ugettext_lazy as _
 from rest_framework.serializers import (
+    Serializer,
     ModelSerializer,
     CharField,
-    ChoiceField
+    ChoiceField,
+    FileField,
+    IntegerField,
 )
 from rest_framework.exceptions import ValidationError
 
@@ -78,3 +81,44 @@ class LocalizeLanguageSerializer(ModelSerializer):
             'name',
             'native'
         ]
+
+
+class LocalizeKeyDeltaSerializer(Serializer):
+    version = IntegerField(min_value=0, required=True)
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
+
+
+class LocalizeKeyScopeSerializer(Serializer):
+    namespaces = CharField(required=False, help_text=_('Comma separated namespace key codes'))
+    prefix = CharField(required=False, help_text=_('Comma separated key prefixes'))
+
+    @staticmethod
+    def split(value: str = '') -> list:
+        return sorted({item.strip() for item in value.split(',') if item.strip()})
+
+    def validate_namespaces(self, value):
+        return self.split(value)
+
+    def validate_prefix(self, value):
+        return self.split(value)
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
+
+
+class LocalizeKeyImportSerializer(Serializer):
+    file = FileField(required=True, help_text=_('Platform file, or zip of platform files'))
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
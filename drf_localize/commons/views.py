@@ -1,28 +1,67 @@
+from io import BytesIO
+from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.parsers import (
+    JSONParser,
+    MultiPartParser,
+)
 from drf_yasg.utils import swagger_auto_schema
 from django.http import (
     Http404,
+    HttpResponse,
     FileResponse
 )
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
 
 # Import your package here.
 
+from drf_localize.commons.parsers import NDJSONParser
 from drf_localize.commons.helpers.views import (
     ExtendedListAPIView,
     BasicModelViewSet
 )
+from drf_localize.settings import settings
 from drf_localize.core import (
-    localize,
+    Localize,
     localize_platform,
 )
 from drf_localize.commons.serializers import (
     LocalizeKeySerializer,
+    LocalizeKeyDeltaSerializer,
+    LocalizeKeyScopeSerializer,
+    LocalizeKeyImportSerializer,
     LocalizeLanguageSerializer
 )
 from drf_localize.models import (
     LocalizeKey,
     LocalizeLanguage
 )
+from drf_localize.catalogs.artifacts import (
+    serve_artifact,
+    get_accepted_encoding,
+    artifact_etag,
+)
+from drf_localize.catalogs.versions import (
+    get_catalog_state,
+    get_catalog_version,
+)
+from drf_localize.catalogs.changes import (
+    get_changes
+)
+from drf_localize.catalogs.lookups import (
+    get_catalog
+)
+from drf_localize.catalogs.imports import (
+    upsert_keys,
+    import_file,
+    import_zip,
+)
 
 
 # Create your views here.
@@ -43,41 +82,257 @@ class LocalizationKeyViewSet(BasicModelViewSet):
     search_fields = filter_set_fields
     ordering_fields = filter_set_fields
 
+    @staticmethod
+    def get_scope(request) -> tuple:
+        """
+        Get (namespaces, prefixes, scope) of a partial export, scope is blank for a full export
+        """
+        serializer = LocalizeKeyScopeSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        namespaces = serializer.validated_data.get('namespaces')
+        prefixes = serializer.validated_data.get('prefix')
+        scope = f'{",".join(namespaces or [])}:{",".join(prefixes or [])}' if namespaces or prefixes else ''
+        return namespaces, prefixes, scope
+
+    @staticmethod
+    def patch_artifact_headers(response, etag: str = '', compressed: bool = False, content_type: str = None):
+        """
+        Set validator & cache headers of an artifact response, 304 responses carry them as well
+        """
+        response['ETag'] = etag
+
+        # Served inline, browsers revalidate with ETag once max age passed
+        if content_type:
+            patch_cache_control(response, private=True, max_age=settings.CATALOG_MAX_AGE)
+
+        if compressed:
+            patch_vary_headers(response, ('Accept-Encoding',))
+
+        # Catalog depends on the application resolved from the API key header
+        if (header := settings.API_KEY_HEADER_NAME).startswith('HTTP_'):
+            patch_vary_headers(response, (header[5:].replace('_', '-'),))
+
+        return response
+
+    def artifact_response(self, request, builder, platform: str = '', language: str = '', compressed: bool = False,
+                          scope: str = '', content_type: str = None):
+        application = getattr(request, 'application', None)
+        encoding = get_accepted_encoding(request=request) if compressed else ''
+        version, modified = get_catalog_state(application=application)
+        etag = artifact_etag(application=application, platform=platform, language=language, version=version,
+                             encoding=encoding, scope=scope)
+        last_modified = int(modified.timestamp()) if modified else None
+
+        # Not modified, nothing is built
+        if response := get_conditional_response(request, etag=etag, last_modified=last_modified):
+            return self.patch_artifact_headers(response, etag=etag, compressed=compressed, content_type=content_type)
+
+        served, filename, content = serve_artifact(
+            builder, application=application, platform=platform, language=language, version=version, encoding=encoding,
+            scope=scope
+        )
+
+        if content_type:
+            response = HttpResponse(content, content_type=content_type)
+        else:
+            response = FileResponse(BytesIO(content), filename=filename, content_type='application/force-download')
+
+        self.patch_artifact_headers(response, etag=etag, compressed=compressed, content_type=content_type)
+        response['X-Localize-Version'] = served
+
+        # Stale artifact of a previous version, served while this version is built
+        if served != version:
+            response['ETag'] = artifact_etag(application=application, platform=platform, language=language,
+                                             version=served, encoding=encoding, scope=scope)
+            patch_cache_control(response, no_cache=True)
+        elif last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+
+        if encoding:
+            response['Content-Encoding'] = encoding
+
+        return response
+
+    @staticmethod
+    def get_upload(request):
+        serializer = LocalizeKeyImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data['file']
+
     @action(detail=False,
             methods=['GET'],
             url_path='(?P<platform>.+)/(?P<language>.+)/file',
-            url_name='file')
-    @swagger_auto_schema()
+            url_name='file',
+            parser_classes=[MultiPartParser])
+    @swagger_auto_schema(query_serializer=LocalizeKeyScopeSerializer)
     def file(self, request, *args, **kwargs):
         platform = kwargs.get('platform', '').upper()
         language = kwargs.get('language', '').lower()
 
-        if (language not in localize.codes) or (platform not in localize_platform.PLATFORM_TYPES):
+        if (language not in Localize.codes) or (platform not in localize_platform.PLATFORM_TYPES):
+            raise Http404()
+
+        namespaces, prefixes, scope = self.get_scope(request=request)
+
+        def builder():
+            instance = Localize().get_keys(request=request, namespaces=namespaces, prefixes=prefixes)
+            instance.build(language=language, namespaces=namespaces, prefixes=prefixes)
+            extension = localize_platform.PLATFORM_EXTENSIONS[platform]
+            return f'keys.{extension}', instance.render_platform(platform=platform)
+
+        return self.artifact_response(request, builder, platform=platform, language=language, compressed=True,
+                                      scope=scope)
+
+    @file.mapping.post
+    @swagger_auto_schema(request_body=LocalizeKeyImportSerializer)
+    def file_import(self, request, *args, **kwargs):
+        platform = kwargs.get('platform', '').upper()
+        language = kwargs.get('language', '').lower()
+        languages = Localize.get_languages(request=request)
+
+        if (language not in languages) or (platform not in localize_platform.PLATFORM_TYPES):
             raise Http404()
 
-        instance = localize.get_keys(request=request).build(language=language)
-        file = instance.to_platform(platform=platform)
-        return FileResponse(open(file, 'rb'), content_type='application/force-download')
+        data = import_file(
+            stream=self.get_upload(request=request),
+            platform=platform,
+            language=language,
+            application=getattr(request, 'application', None),
+            languages=languages,
+        )
+        return Response(data=data)
 
     @action(detail=False,
             methods=['GET'],
             url_path='(?P<platform>.+)/zip',
-            url_name='file')
-    @swagger_auto_schema()
+            url_name='file',
+            parser_classes=[MultiPartParser])
+    @swagger_auto_schema(query_serializer=LocalizeKeyScopeSerializer)
     def file_zip(self, request, *args, **kwargs):
         platform = kwargs.get('platform', '').upper()
 
         if platform not in localize_platform.PLATFORM_TYPES:
             raise Http404()
 
-        zips = localize.get_keys(request=request).build_zip(request=request, platform=platform)
-        return FileResponse(open(zips, 'rb'), content_type='application/force-download')
+        namespaces, prefixes, scope = self.get_scope(request=request)
+
+        def builder():
+            return Localize().get_keys(request=request, namespaces=namespaces, prefixes=prefixes).render_zip(
+                request=request, platform=platform, namespaces=namespaces, prefixes=prefixes
+            )
+
+        return self.artifact_response(request, builder, platform=platform, scope=scope)
+
+    @file_zip.mapping.post
+    @swagger_auto_schema(request_body=LocalizeKeyImportSerializer)
+    def file_zip_import(self, request, *args, **kwargs):
+        if kwargs.get('platform', '').upper() not in localize_platform.PLATFORM_TYPES:
+            raise Http404()
+
+        return self.zip_import(request, *args, **kwargs)
 
     @action(detail=False,
             methods=['GET'],
             url_path='zip',
-            url_name='file')
-    @swagger_auto_schema()
+            url_name='file',
+            parser_classes=[MultiPartParser])
+    @swagger_auto_schema(query_serializer=LocalizeKeyScopeSerializer)
     def zip(self, request, *args, **kwargs):
-        zips = localize.get_keys(request=request).build_zip(request=request)
-        return FileResponse(open(zips, 'rb'), content_type='application/force-download')
+        namespaces, prefixes, scope = self.get_scope(request=request)
+
+        def builder():
+            return Localize().get_keys(request=request, namespaces=namespaces, prefixes=prefixes).render_zip(
+                request=request, namespaces=namespaces, prefixes=prefixes
+            )
+
+        return self.artifact_response(request, builder, scope=scope)
+
+    @zip.mapping.post
+    @swagger_auto_schema(request_body=LocalizeKeyImportSerializer)
+    def zip_import(self, request, *args, **kwargs):
+        data = import_zip(
+            stream=self.get_upload(request=request),
+            application=getattr(request, 'application', None),
+            languages=Localize.get_languages(request=request),
+        )
+        return Response(data=data)
+
+    @action(detail=False,
+            methods=['GET'],
+            url_path=r'(?P<language>[^/.]+)\.json',
+            url_name='json')
+    @swagger_auto_schema()
+    def language_json(self, request, *args, **kwargs):
+        language = kwargs.get('language', '').lower()
+
+        if language not in Localize.codes:
+            raise Http404()
+
+        def builder():
+            application = getattr(request, 'application', None)
+            catalog = get_catalog(application=application, version=get_catalog_version(application=application))
+
+            if language not in catalog.values:
+                raise Http404()
+
+            return f'{language}.json', Localize().render_json(catalog.mapping(language=language))
+
+        return self.artifact_response(request, builder, platform='JSON', language=language, compressed=True,
+                                      content_type='application/json')
+
+    @action(detail=False,
+            methods=['GET'],
+            url_path=r'(?P<namespace>[^/]+)/(?P<language>[^/.]+)\.json',
+            url_name='json')
+    @swagger_auto_schema()
+    def namespace_json(self, request, *args, **kwargs):
+        namespace = kwargs.get('namespace', '')
+        language = kwargs.get('language', '').lower()
+
+        if language not in Localize.codes:
+            raise Http404()
+
+        def builder():
+            application = getattr(request, 'application', None)
+            catalog = get_catalog(application=application, version=get_catalog_version(application=application))
+
+            if (language not in catalog.values) or (namespace not in catalog.namespaces):
+                raise Http404()
+
+            return f'{language}.json', Localize().render_json(catalog.mapping(language=language, namespace=namespace))
+
+        return self.artifact_response(request, builder, platform='JSON', language=language, compressed=True,
+                                      scope=namespace, content_type='application/json')
+
+    @action(detail=False,
+            methods=['GET'],
+            url_path='delta',
+            url_name='delta')
+    @swagger_auto_schema(query_serializer=LocalizeKeyDeltaSerializer)
+    def delta(self, request, *args, **kwargs):
+        serializer = LocalizeKeyDeltaSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        data = get_changes(
+            application=getattr(request, 'application', None),
+            version=serializer.validated_data['version'],
+            languages=Localize.get_languages(request=request),
+        )
+
+        # Catalog was reset since the version, whole catalog is to be downloaded again
+        return Response(data=data, status=status.HTTP_409_CONFLICT if data['full'] else status.HTTP_200_OK)
+
+    @action(detail=False,
+            methods=['POST'],
+            url_path='bulk',
+            url_name='bulk',
+            parser_classes=[JSONParser, NDJSONParser])
+    @swagger_auto_schema(request_body=LocalizeKeySerializer(many=True))
+    def bulk(self, request, *args, **kwargs):
+        data = upsert_keys(
+            items=request.data,
+            application=getattr(request, 'application', None),
+            languages=Localize.get_languages(request=request),
+        )
+        return Response(data=data)
@@ -1,18 +1,38 @@
 import json
 import os
-import shutil
-import xml.etree.cElementTree as et
-from time import time
-from typing import Union
+import sys
+from io import BytesIO
+from django.db.models import Q
 from django.db.models.base import ModelBase
 from contextlib import suppress
-from zipfile import ZipFile
+from zipfile import (
+    ZipFile,
+    ZipInfo,
+)
 
 # Import your package here.
 
 from drf_localize.settings import settings
-from drf_localize.commons.helpers import upsert_file
+from drf_localize.commons.helpers import (
+    write_file,
+    stream_file,
+)
 from drf_localize.commons.helpers.classes import LocalizeENUM
+from drf_localize.core.catalog import LocalizeCatalog
+from drf_localize.core.renderers import (
+    write_xml,
+    write_json,
+    write_strings,
+)
+from drf_localize.core.languages import (
+    get_application_languages,
+    get_model_languages,
+)
+
+# Create your constants here.
+
+# Earliest zip timestamp, zip entries are not stamped with build time
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
 
 
 # Create your classes here.
@@ -28,6 +48,23 @@ class LocalizePlatform:
         (PLATFORM_ANDROID, PLATFORM_ANDROID),
         (PLATFORM_WEB, PLATFORM_WEB)
     )
+    PLATFORM_EXTENSIONS = {
+        PLATFORM_IOS: 'strings',
+        PLATFORM_ANDROID: 'xml',
+        PLATFORM_WEB: 'json',
+    }
+    PLATFORM_FILES = {
+        PLATFORM_IOS: '{language}.lproj/Localizable.strings',
+        PLATFORM_ANDROID: 'values-{language}/strings.xml',
+        PLATFORM_WEB: '{language}/locales.json',
+    }
+    PLATFORM_ZIPS = {
+        PLATFORM_IOS: 'Localizable.zip',
+        PLATFORM_ANDROID: 'strings.zip',
+        PLATFORM_WEB: 'locales.zip',
+    }
+    PLATFORM_BUNDLE_ORDER = [PLATFORM_ANDROID, PLATFORM_IOS, PLATFORM_WEB]
+    PLATFORM_BUNDLE_ZIP = 'localize.zip'
 
 
 localize_platform = LocalizePlatform()
@@ -48,16 +85,32 @@ localize_key_type = LocalizeKeyType()
 
 
 class Localize:
-    i18n: dict = {}
-    key: str = ''
-    namespace: str = ''
+    """
+    Localization catalog builder, every instance holds its own state, so create one per request
+    """
     codes: list = []
-    mapping: dict = {}
-    language: str = ''
-    namespaces: list = []
-    keys: list = []
+    i18n: dict
+    key: str
+    namespace: str
+    mapping: dict
+    language: str
+    namespaces: dict
+    keys: dict
 
     def __init__(self):
+        self.i18n = {}
+        self.key = ''
+        self.namespace = ''
+        self.mapping = {}
+        self.language = ''
+
+        # Ordered sets of key & namespace names
+        self.namespaces = {}
+        self.keys = {}
+
+        # Language -> fallback languages chain
+        self.fallbacks = {}
+
         self._methods()
 
     def _methods(self):
@@ -65,6 +118,10 @@ class Localize:
         Attach dynamic methods to set language translation
         """
 
+        # Methods are attached to the class, once
+        if self.codes:
+            return
+
         def make_method(code=''):
             def wrapper(context, value=''):
                 if not any([context.key, context.namespace]):
@@ -113,8 +170,8 @@ class Localize:
             return self.codes
 
         path = os.path.abspath(os.path.dirname(__file__))
-        file = open(f'{os.path.join(path, source)}')
-        objects = json.load(file)
+        with open(f'{os.path.join(path, source)}') as file:
+            objects = json.load(file)
 
         for element in objects:
             fields = element.get('fields', {})
@@ -123,22 +180,20 @@ class Localize:
         return list(set(self.codes))
 
     @staticmethod
-    def get_languages(request=None) -> list:
+    def get_languages(request=None, cached: bool = True) -> list:
         """
-        Get languages from request application or settings or model
+        Get languages from request application or settings or model, language lists are cached.
+        Builders run once per catalog version read them uncached, other processes may hold stale lists
         """
-        field = settings.LANGUAGE_MODEL_CLASS_FIELD
         application = getattr(request, 'application', None)
         localize_languages = []
-        application_languages = list(application.languages.values_list(field, flat=True)) if application else []
+        application_languages = get_application_languages(application=application, cached=cached)
         model = settings.LANGUAGE_MODEL_CLASS
 
         if (not application_languages) and issubclass(type(model), ModelBase):
             # Ignore any exception from invalid model
             with suppress(Exception):
-                localize_languages = list(
-                    model.objects.values_list(field, flat=True)
-                )
+                localize_languages = get_model_languages(cached=cached)
 
         # Application languages has higher priority
         service_languages = settings.LANGUAGES
@@ -147,6 +202,63 @@ class Localize:
 
         return list(set(localize_languages).intersection(service_languages))
 
+    @staticmethod
+    def get_fallbacks(application=None, languages: list = None) -> dict:
+        """
+        Resolve language -> fallback languages chains, application fallbacks override settings ones
+        """
+        fallbacks = {**settings.FALLBACKS, **(getattr(application, 'fallbacks', None) or {})}
+        chains = {}
+
+        for language in languages or []:
+            chain, pending = [], list(fallbacks.get(language, []))
+
+            # Walk fallbacks of fallbacks, skipping cycles
+            while pending:
+                if (fallback := pending.pop(0)) in chain or fallback == language:
+                    continue
+
+                chain.append(fallback)
+                pending.extend(fallbacks.get(fallback, []))
+
+            if chain:
+                chains[language] = chain
+
+        return chains
+
+    def set_fallbacks(self, fallbacks: dict = None):
+        self.fallbacks = fallbacks or {}
+        return self
+
+    def _sources(self, languages: list = None) -> list:
+        # Languages with their fallback languages, once
+        return list(dict.fromkeys(
+            [*languages, *[fallback for language in languages for fallback in self.fallbacks.get(language, [])]]
+        ))
+
+    def _fallback(self, table: dict = None, languages: list = None) -> dict:
+        """
+        Fill missing & blank values of language -> {key -> value} table from fallback languages
+        """
+        resolved = {}
+
+        for language in languages:
+            if not (chain := self.fallbacks.get(language)):
+                resolved[language] = table[language]
+                continue
+
+            mapping = {}
+            for fallback in reversed(chain):
+                mapping.update((key, value) for key, value in table[fallback].items() if value)
+
+            for key, value in table[language].items():
+                if value or key not in mapping:
+                    mapping[key] = value
+
+            resolved[language] = mapping
+
+        return resolved
+
     def set_key(self, name: str = ''):
         if not isinstance(name, str):
             raise ValueError('Localize key name string type expected')
@@ -154,7 +266,7 @@ class Localize:
         self.i18n.update({name: {}})
         self.key = name
         self.namespace = ''
-        self.keys.append(name)
+        self.keys[name] = None
         return self
 
     def set_key_namespace(self, name: str = ''):
@@ -164,7 +276,7 @@ class Localize:
         self.i18n.update({name: {}})
         self.namespace = name
         self.key = ''
-        self.namespaces.append(name)
+        self.namespaces[name] = None
         return self
 
     def reset(self):
@@ -214,188 +326,210 @@ class Localize:
             raise ValueError('Unknown localize language')
 
         self.mapping = {}
-        for code, i18n in self.i18n.items():
-            if not isinstance(i18n, dict) or code != namespace:
+        i18n = self.i18n.get(namespace, {})
+        keyed = i18n.get(language, {}) if isinstance(i18n, dict) else {}
+
+        if isinstance(keyed, dict):
+            self.mapping.update(keyed)
+
+        self.language = language
+        return self
+
+    @staticmethod
+    def _scope(keyed: dict = None, prefixes: tuple = ()) -> dict:
+        if not prefixes:
+            return keyed
+
+        return {key: value for key, value in keyed.items() if key.startswith(prefixes)}
+
+    def compile(self, languages: list = None, namespaces: list = None, prefixes: list = None) -> dict:
+        """
+        Compile language -> {key -> value} table walking keys once, plain keys override namespace keys.
+        Table is scoped to namespaces, plain keys left out, and to key prefixes if set.
+        Missing values are resolved from fallback languages
+        """
+        if languages is None:
+            languages = self.codes
+
+        requested, languages = languages, self._sources(languages=languages)
+        plain = {language: {} for language in languages}
+        namespaced = {language: {} for language in languages}
+        prefixes = tuple(prefixes or ())
+
+        # Selected namespaces are looked up, others are never walked
+        codes = self.i18n if namespaces is None else [code for code in namespaces if code in self.namespaces]
+
+        for code in codes:
+            i18n = self.i18n.get(code)
+
+            if not isinstance(i18n, dict):
                 continue
 
-            keyed = i18n.get(language, {})
-            if not isinstance(keyed, dict):
+            if prefixes and code in self.keys and not code.startswith(prefixes):
                 continue
 
-            for key, value in keyed.items():
-                self.mapping.update({key: value})
+            for language, value in i18n.items():
+                # Plain key value
+                if isinstance(value, str):
+                    if language in plain:
+                        plain[language][code] = value
+                    continue
+
+                # Namespace keys
+                if isinstance(value, dict) and language in namespaced:
+                    namespaced[language].update(self._scope(keyed=value, prefixes=prefixes))
 
-        self.language = language
-        return self
+        table = {language: {**namespaced[language], **plain[language]} for language in languages}
+        return self._fallback(table=table, languages=requested)
 
-    def build(self, language: str = ''):
-        if language not in self.codes:
-            raise ValueError('Unknown localize language')
+    def compile_namespaces(self, languages: list = None) -> dict:
+        """
+        Compile namespace -> language -> {key -> value} table of namespace keys
+        """
+        if languages is None:
+            languages = self.codes
 
-        self.mapping = {}
-        mapping = {}
+        table = {}
+        sources = self._sources(languages=languages)
 
-        # Building namespaces
         for namespace in self.namespaces:
-            mapping.update(**self.build_keys_namespace(namespace=namespace, language=language).mapping)
+            i18n = self.i18n.get(namespace)
+            i18n = i18n if isinstance(i18n, dict) else {}
+
+            table[namespace] = self._fallback(table={
+                language: dict(i18n[language]) if isinstance(i18n.get(language), dict) else {}
+                for language in sources
+            }, languages=languages)
 
-        # Building keys
-        mapping.update(**self.build_keys(language=language).mapping)
+        return table
 
-        self.mapping = mapping
+    def to_catalog(self, languages: list = None, version: int = 0) -> LocalizeCatalog:
+        """
+        Compile keys into a compact catalog, used to keep catalogs in memory
+        """
+        if languages is None:
+            languages = self.codes
+
+        return LocalizeCatalog.from_tables(
+            version=version,
+            table=self.compile(languages=languages),
+            namespaces=self.compile_namespaces(languages=languages),
+        )
+
+    def build(self, language: str = '', namespaces: list = None, prefixes: list = None):
+        if language not in self.codes:
+            raise ValueError('Unknown localize language')
+
+        self.mapping = self.compile(languages=[language], namespaces=namespaces, prefixes=prefixes)[language]
         self.language = language
         return self
 
     @staticmethod
-    def _make_language(language, mapping=None):
-        if mapping is None:
-            mapping = {}
-        # Add language code key to mapping
-        if not mapping.get(language, None):
-            mapping.update({language: {}})
-        return mapping
-
-    @staticmethod
-    def _make_zip(filename='', files=None):
+    def _make_zip(files: dict = None) -> bytes:
         if files is None:
-            files = []
-
-        filename = f'{filename}.zip'
-        zip_object = ZipFile(filename, 'w')
+            files = {}
+
+        buffer = BytesIO()
+        with ZipFile(buffer, 'w', compression=settings.ZIP_COMPRESSION,
+                     compresslevel=settings.ZIP_COMPRESSION_LEVEL) as zip_object:
+            # Fixed entry order & timestamps, so the same catalog version is zipped to the same bytes
+            for name, content in sorted(files.items()):
+                info = ZipInfo(name, date_time=ZIP_DATE_TIME)
+                info.external_attr = 0o644 << 16
+                zip_object.writestr(info, content, compress_type=settings.ZIP_COMPRESSION,
+                                    compresslevel=settings.ZIP_COMPRESSION_LEVEL)
+
+        return buffer.getvalue()
+
+    @classmethod
+    def make_bundle(cls, files: dict = None, platform: str = None) -> tuple:
+        """
+        Zip platform -> {filename -> content} files, every platform zip is nested in a single zip if platform is not set
+        """
+        if files is None:
+            files = {}
 
-        for file in files:
-            zip_object.write(file)
+        zips = {}
+        for typing in localize_platform.PLATFORM_BUNDLE_ORDER:
+            if typing in files:
+                zips[localize_platform.PLATFORM_ZIPS[typing]] = cls._make_zip(files=files[typing])
 
-            if (path := os.path.dirname(file)) != '':
-                shutil.rmtree(path)
-            else:
-                os.remove(file)
+        if not platform:
+            return localize_platform.PLATFORM_BUNDLE_ZIP, cls._make_zip(files=zips)
 
-        zip_object.close()
-        return filename
+        return next(iter(zips.items()))
 
-    def build_zip(self, request=None, platform: str = None) -> Union[str, list]:
+    def render_zip(self, request=None, platform: str = None, namespaces: list = None, prefixes: list = None) -> tuple:
+        """
+        Render platform zip in memory, every platform zip is nested in a single zip if platform is not set
+        """
         if platform and platform not in localize_platform.PLATFORM_TYPES:
             raise ValueError('Unknown localize platform')
 
         self.mapping = {}
-        mapping = {}
-        sources = {'namespaces': {}, 'keys': {}}
-        languages = self.get_languages(request=request)
-
-        # Build mapper for each language
-        for language in languages:
-            sources['keys'].update({
-                language: self.build_keys(language=language).mapping
-            })
-
-            for namespace in self.namespaces:
-                # Add namespace code key to namespace
-                if not sources['namespaces'].get(namespace, None):
-                    sources['namespaces'].update({namespace: {}})
-
-                sources['namespaces'][namespace].update({
-                    language: self.build_keys_namespace(namespace=namespace, language=language).mapping
-                })
+        languages = self.get_languages(request=request, cached=False)
+        mapping = self.compile(languages=languages, namespaces=namespaces, prefixes=prefixes)
+        platforms = [platform] if platform else localize_platform.PLATFORM_TYPES
+        files = {typing: {} for typing in platforms}
 
         # Building
-        strings = []
-        jsons = []
-        xml = []
-
-        for language, keys in sources['keys'].items():
-            self._make_language(language=language, mapping=mapping)
-            mapping[language].update(**keys)
+        for language, keys in mapping.items():
+            for typing in platforms:
+                filename = localize_platform.PLATFORM_FILES[typing].format(language=language)
+                files[typing][filename] = self.render_platform(platform=typing, mapping=keys)
 
-        for namespace, source in sources['namespaces'].items():
-            for language, keys in source.items():
-                self._make_language(language=language, mapping=mapping)
-                mapping[language].update(**keys)
+        return self.make_bundle(files=files, platform=platform)
 
-        for language, keys in mapping.items():
-            if not platform or platform == localize_platform.PLATFORM_IOS:
-                strings.append(self.to_strings(filename=f'{language}.lproj/Localizable', mapping=keys))
-            if not platform or platform == localize_platform.PLATFORM_WEB:
-                jsons.append(self.to_json(filename=f'{language}/locales', mapping=keys))
-            if not platform or platform == localize_platform.PLATFORM_ANDROID:
-                xml.append(self.to_xml(filename=f'values-{language}/strings', mapping=keys))
-
-        # Zip objects
-        zips = []
-        if not platform or platform == localize_platform.PLATFORM_ANDROID:
-            zips.append(self._make_zip('strings', files=xml))
-        if not platform or platform == localize_platform.PLATFORM_IOS:
-            zips.append(self._make_zip('Localizable', files=strings))
-        if not platform or platform == localize_platform.PLATFORM_WEB:
-            zips.append(self._make_zip('locales', files=jsons))
+    def build_zip(self, request=None, platform: str = None, namespaces: list = None, prefixes: list = None) -> str:
+        filename, content = self.render_zip(request=request, platform=platform, namespaces=namespaces,
+                                            prefixes=prefixes)
+        return write_file(filename, content)
 
-        if not platform:
-            zips = self._make_zip(str(int(time())), files=zips)
+    def _source(self, mapping: dict = None) -> dict:
+        return self.mapping if not mapping else mapping
 
-        if platform and zips:
-            zips = next(iter(zips))
+    def render_xml(self, mapping: dict = None) -> bytes:
+        buffer = BytesIO()
+        write_xml(stream=buffer, mapping=self._source(mapping=mapping))
+        return buffer.getvalue()
 
-        return zips
+    def render_json(self, mapping: dict = None) -> bytes:
+        buffer = BytesIO()
+        write_json(stream=buffer, mapping=self._source(mapping=mapping))
+        return buffer.getvalue()
 
-    def to_xml(self, filename: str = 'keys', mapping: dict = None) -> str:
-        if mapping is None:
-            mapping = {}
+    def render_strings(self, mapping: dict = None) -> bytes:
+        buffer = BytesIO()
+        write_strings(stream=buffer, mapping=self._source(mapping=mapping))
+        return buffer.getvalue()
 
-        def _pretty_print(current, parent=None, index: int = -1, depth: int = 0):
-            for i, node in enumerate(current):
-                _pretty_print(node, current, i, depth + 1)
-
-            if parent is not None:
-                if index == 0:
-                    parent.text = '\n' + ('\t' * depth)
-                else:
-                    parent[index - 1].tail = '\n' + ('\t' * depth)
-                if index == len(parent) - 1:
-                    current.tail = '\n' + ('\t' * (depth - 1))
-
-        filename = f'{filename}.xml'
-        upsert_file(filename)
-        root = et.Element('resources')
-        source = self.mapping.items() if not mapping else mapping.items()
-        for code, translate in source:
-            doc = et.SubElement(root, "string")
-            doc.attrib['name'] = code
-            doc.text = translate or " "
-
-        _pretty_print(root)  # noqa
-        tree = et.ElementTree(root)
-        tree.write(filename, encoding='UTF-8', xml_declaration=True)
-        return filename
+    def render_platform(self, platform: str = '', mapping: dict = None) -> bytes:
+        if platform not in localize_platform.PLATFORM_TYPES:
+            raise ValueError('Unknown localize platform')
 
-    def to_json(self, filename: str = 'keys', mapping: dict = None) -> str:
-        if mapping is None:
-            mapping = {}
+        if platform == localize_platform.PLATFORM_ANDROID:
+            return self.render_xml(mapping=mapping)
 
-        source = self.mapping if not mapping else mapping
-        lines = json.dumps(source, indent=4, sort_keys=True)
+        if platform == localize_platform.PLATFORM_IOS:
+            return self.render_strings(mapping=mapping)
 
-        filename = f'{filename}.json'
-        upsert_file(filename)
-        with open(filename, 'w') as f:
-            f.write(lines)
-        return filename
+        return self.render_json(mapping=mapping)
 
-    def to_strings(self, filename: str = 'keys', mapping: dict = None) -> str:
-        if mapping is None:
-            mapping = {}
+    @classmethod
+    def render_file(cls, platform: str = '', language: str = '', mapping: dict = None) -> tuple:
+        """
+        Render a language file with a fresh builder, returns (platform, language, content), used by process pools
+        """
+        return platform, language, cls().render_platform(platform=platform, mapping=mapping)
 
-        lines = []
-        source = self.mapping.items() if not mapping else mapping.items()
-        for code, translate in source:
-            line = f'"{code}" = "{translate}";'
-            lines.append(line)
+    def to_xml(self, filename: str = 'keys', mapping: dict = None) -> str:
+        return stream_file(f'{filename}.xml', lambda stream: write_xml(stream, self._source(mapping=mapping)))
 
-        filename = f'{filename}.strings'
-        upsert_file(filename)
-        with open(filename, 'w') as f:
-            f.write('\n'.join(lines))
+    def to_json(self, filename: str = 'keys', mapping: dict = None) -> str:
+        return stream_file(f'{filename}.json', lambda stream: write_json(stream, self._source(mapping=mapping)))
 
-        return filename
+    def to_strings(self, filename: str = 'keys', mapping: dict = None) -> str:
+        return stream_file(f'{filename}.strings', lambda stream: write_strings(stream, self._source(mapping=mapping)))
 
     def to_platform(self, platform: str = '', filename: str = 'keys') -> str:
         if platform not in localize_platform.PLATFORM_TYPES:
@@ -409,19 +543,64 @@ class Localize:
 
         return self.to_json(filename=filename)
 
-    def get_keys(self, request=None):
+    def get_keys(self, request=None, namespaces: list = None, prefixes: list = None):
+        """
+        Set keys from key model, languages are resolved once and keys are streamed in chunks.
+        Only selected namespace keys are loaded if namespaces are set, and only plain keys of prefixes if set
+        """
         model = settings.KEY_MODEL_CLASS
-        translations = model.objects.values_list('code', 'i18n', 'type')
+        languages = self.get_languages(request=request, cached=False)
+        # Stable row order, so a catalog version is always rendered to the same bytes
+        queryset = model.objects.order_by('id')
 
-        for code, i18n, typing in translations:
-            key = localize.set_key(code)
+        # Fallback languages are loaded too, to resolve missing values at compile time
+        self.set_fallbacks(self.get_fallbacks(application=getattr(request, 'application', None), languages=languages))
+        languages = self._sources(languages=languages)
+
+        if namespaces is not None:
+            queryset = queryset.filter(type=localize_key_type.KEY_NAMESPACE, code__in=namespaces)
+
+        # Namespace keys are loaded whole, their keys are scoped to prefixes at compile time
+        if prefixes:
+            matching = Q(type=localize_key_type.KEY_NAMESPACE)
+            for prefix in prefixes:
+                matching |= Q(code__startswith=prefix)
+
+            queryset = queryset.filter(matching)
+
+        translations = queryset.values_list('code', 'i18n', 'type').iterator(chunk_size=settings.KEY_CHUNK_SIZE)
+
+        return self.set_keys(translations=translations, languages=languages)
+
+    def set_keys(self, translations=None, languages: list = None):
+        """
+        Set keys from (code, i18n, type) rows, invalid language values are skipped.
+        Codes & namespace keys are interned, so languages share key strings
+        """
+        if languages is None:
+            languages = self.codes
+
+        for code, i18n, typing in translations or []:
+            code = sys.intern(code)
+            i18n = i18n if isinstance(i18n, dict) else {}
 
             if typing == localize_key_type.KEY_NAMESPACE:
-                key = localize.set_key_namespace(code)
+                values = self.set_key_namespace(code).i18n[code]
 
-            for language in localize.get_languages(request=request):
+                for language in languages:
+                    keyed = i18n.get(language, {})
+                    if not isinstance(keyed, dict):
+                        continue
+
+                    values[language] = {sys.intern(key): item for key, item in keyed.items() if isinstance(item, str)}
+                continue
+
+            values = self.set_key(code).i18n[code]
+
+            for language in languages:
                 value = i18n.get(language, '')
-                getattr(key, f'set_{language}')(value)
+                if isinstance(value, str):
+                    values[language] = value
 
         return self
 
@@ -439,54 +618,85 @@ class Localize:
 
         return translate, field, auto_update
 
-    def _signal(self, model=None):
+    @staticmethod
+    def _backfill_i18n(i18n: dict = None, languages: list = None, translate: list = None) -> bool:
+        """
+        Add missing languages & remove unknown languages from i18n, returns whether i18n was changed
+        """
+        keys = list(i18n.keys())
+        difference_to_update = list(set(languages).difference(keys))
+        difference_to_delete = list(set(keys).difference(languages))
+
+        if not difference_to_update and not difference_to_delete:
+            return False
+
+        for language in difference_to_delete:
+            i18n.pop(language, None)
+
+        for language in difference_to_update:
+            i18n.update({language: {}})
+
+            for translate_field in translate:
+                i18n[language].update({translate_field: ''})
+
+        return True
+
+    def backfill(self, model=None, languages: list = None, batch_size: int = None, start=None, progress=None) -> int:
+        """
+        Backfill LOCALIZE_AUTO_UPDATE model translations in primary key order and bounded batches.
+        Pass the last reported primary key as `start` to resume, `progress(pk, updated)` is called after each batch
+        of scanned rows, current rows included.
+        """
         if not model or not issubclass(type(model), ModelBase):
-            return self
+            return 0
 
         translate, field, auto_update = self._model_set(model=model)
 
         if not all([translate, field, auto_update]):
-            return self
+            return 0
 
-        languages = self.get_languages()
-        objects = []
-        queryset = model.objects.all()
+        if languages is None:
+            languages = self.get_languages(cached=False)
 
-        for element in queryset:
-            i18n = getattr(element, field, None)
+        batch_size = batch_size or settings.BACKFILL_BATCH_SIZE
+        manager = model._base_manager  # noqa
+        queryset = manager.only('pk', field).order_by('pk')
 
-            if not i18n:
-                continue
+        if start is not None:
+            queryset = queryset.filter(pk__gt=start)
 
-            keys = list(i18n.keys())
-            difference_to_update = list(set(languages).difference(keys))
-            difference_to_delete = list(set(keys).difference(languages))
+        objects = []
+        updated = 0
+        last = start
 
-            if not difference_to_update and not difference_to_delete:
-                continue
+        def flush():
+            if objects:
+                manager.bulk_update(objs=objects, fields=[field], batch_size=batch_size)
+                objects.clear()
 
-            for language in difference_to_delete:
-                i18n.pop(language, None)
+            if progress:
+                progress(last, updated)
 
-            for language in difference_to_update:
-                i18n.update({language: {}})
+        for scanned, element in enumerate(queryset.iterator(chunk_size=batch_size), start=1):
+            last = element.pk
+            i18n = getattr(element, field, None)
+
+            if i18n and self._backfill_i18n(i18n=i18n, languages=languages, translate=translate):
+                # Set updatable field
+                setattr(element, field, i18n)
+                objects.append(element)
+                updated += 1
 
-                for translate_field in translate:
-                    i18n[language].update({translate_field: ''})
+            # Bulk update model objects, every scanned batch is reported so runs resume after it
+            if scanned % batch_size == 0:
+                flush()
 
-            # Set updatable field
-            setattr(element, field, i18n)
-            objects.append(element)
+        flush()
+        return updated
 
-        # Bulk update model objects
-        if length := len(objects):
-            model.objects.bulk_update(
-                objs=objects,
-                fields=[
-                    field,
-                ],
-                batch_size=length,
-            )
+    def _signal(self, model=None):
+        self.backfill(model=model)
+        return self
 
 
 # Export localize instance
@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from concurrent.futures import (
+    Future,
+    TimeoutError as FutureTimeoutError,
+)
+from threading import RLock
+from time import monotonic
+
+# Create your cache classes here.
+
+
+class LocalizeLRUCache:
+    """
+    Thread-safe, bounded, least recently used in-process cache.
+    Concurrent get_or_set calls of a missing key build it once, others wait for it up to `wait` seconds
+    """
+    missing = object()
+
+    def __init__(self, maxsize: int = 128, timeout: float = None, wait: float = None):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.wait = wait
+        self._data = OrderedDict()
+        self._lock = RLock()
+        self._pending = {}
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return self.get(key, self.missing) is not self.missing
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key, self.missing)
+
+            if item is self.missing:
+                return default
+
+            value, expires = item
+            if expires is not None and expires <= monotonic():
+                self._data.pop(key, None)
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout: float = None):
+        timeout = self.timeout if timeout is None else timeout
+        expires = monotonic() + timeout if timeout else None
+
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+
+            # Evict least recently used entries
+            while self.maxsize and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return value
+
+    def pending(self, key) -> bool:
+        return key in self._pending
+
+    def get_or_set(self, key, default=None, timeout: float = None):
+        value = self.get(key, self.missing)
+
+        if value is not self.missing:
+            return value
+
+        if not callable(default):
+            return self.set(key, default, timeout=timeout)
+
+        with self._lock:
+            # Set meanwhile
+            if (value := self.get(key, self.missing)) is not self.missing:
+                return value
+
+            future = self._pending.get(key)
+            if owner := future is None:
+                future = self._pending[key] = Future()
+
+        if not owner:
+            # Built by another thread, built here as well if it takes too long
+            try:
+                return future.result(timeout=self.wait)
+            except FutureTimeoutError:
+                return self.set(key, default(), timeout=timeout)
+
+        try:
+            value = self.set(key, default(), timeout=timeout)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,87 @@
+import sys
+
+
+# Create your classes here.
+
+class LocalizeCatalog:
+    """
+    Compact, immutable compiled catalog, keys are interned & mapped to ids indexing per language value arrays
+    """
+    __slots__ = ('version', 'keys', 'namespaces', 'values')
+
+    def __init__(self, version: int = 0, keys: dict = None, namespaces: dict = None, values: dict = None):
+        self.version = version
+        # Key -> id, as exported
+        self.keys = keys or {}
+        # Namespace -> key -> id
+        self.namespaces = namespaces or {}
+        # Language -> values list, indexed by key id
+        self.values = values or {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_tables(cls, version: int = 0, table: dict = None, namespaces: dict = None):
+        """
+        Build catalog of language -> {key -> value} & namespace -> language -> {key -> value} tables
+        """
+        table = table or {}
+        namespaces = namespaces or {}
+        size = 0
+
+        def index(mappings=None) -> dict:
+            nonlocal size
+            scope = {}
+
+            for mapping in mappings:
+                for key in mapping:
+                    if key not in scope:
+                        scope[sys.intern(key)] = size
+                        size += 1
+
+            return scope
+
+        keys = index(table.values())
+        scoped = {
+            sys.intern(namespace): index(languages.values())
+            for namespace, languages in namespaces.items()
+        }
+
+        # Values of every scope are laid out one after another, in key id order
+        values = {}
+        for language, mapping in table.items():
+            items = list(map(mapping.get, keys))
+
+            for namespace, scope in scoped.items():
+                items.extend(map(namespaces[namespace].get(language, {}).get, scope))
+
+            values[language] = items
+
+        return cls(version=version, keys=keys, namespaces=scoped, values=values)
+
+    def get(self, key: str = '', language: str = '', namespace: str = None, default=None):
+        """
+        Get key value of a language, O(1)
+        """
+        scope = self.keys if namespace is None else self.namespaces.get(namespace, {})
+
+        if (identifier := scope.get(key)) is None or (values := self.values.get(language)) is None:
+            return default
+
+        value = values[identifier]
+        return default if value is None else value
+
+    def items(self, language: str = '', namespace: str = None):
+        """
+        Iterate (key, value) pairs of a language, or of a namespace language
+        """
+        scope = self.keys if namespace is None else self.namespaces.get(namespace, {})
+        values = self.values.get(language, [])
+
+        for key, identifier in scope.items():
+            if (value := values[identifier]) is not None:
+                yield key, value
+
+    def mapping(self, language: str = '', namespace: str = None) -> dict:
+        return dict(self.items(language=language, namespace=namespace))
@@ -0,0 +1,92 @@
+from time import time
+from django.core.cache import caches
+
+# Import your package here.
+
+from drf_localize.settings import settings
+from drf_localize.core.caches import LocalizeLRUCache
+
+# Create your caches here.
+
+language_cache = LocalizeLRUCache(maxsize=settings.LANGUAGE_CACHE_SIZE, timeout=settings.LANGUAGE_CACHE_TIMEOUT)
+
+GENERATION_KEY = 'drf_localize:languages'
+
+
+# Create your helper functions here.
+
+def _generation() -> int:
+    return int(time() * 1000)
+
+
+def _shared_cache():
+    alias = settings.LANGUAGE_CACHE_ALIAS
+    return caches[alias] if alias else None
+
+
+def _shared_key(cache, name: str = '') -> str:
+    # Generation is bumped to invalidate every shared language list at once
+    generation = cache.get_or_set(GENERATION_KEY, _generation, timeout=None)
+    return f'{GENERATION_KEY}:{generation}:{name}'
+
+
+def _get(name: str = '', loader=None, cached: bool = True) -> list:
+    """
+    Get language codes from process cache, then shared cache, then database.
+    Without cached, codes are read from database & cached again
+    """
+    if cached and (languages := language_cache.get(name)) is not None:
+        return list(languages)
+
+    cache = _shared_cache()
+    key = _shared_key(cache, name=name) if cache else None
+
+    if cached and cache and (languages := cache.get(key)) is not None:
+        return list(language_cache.set(name, tuple(languages)))
+
+    languages = tuple(loader())
+    if cache:
+        cache.set(key, languages, timeout=None)
+
+    return list(language_cache.set(name, languages))
+
+
+def get_application_languages(application=None, cached: bool = True) -> list:
+    if not application:
+        return []
+
+    field = settings.LANGUAGE_MODEL_CLASS_FIELD
+    return _get(
+        name=f'application:{application.id}',
+        loader=lambda: application.languages.values_list(field, flat=True),
+        cached=cached
+    )
+
+
+def get_model_languages(cached: bool = True) -> list:
+    field = settings.LANGUAGE_MODEL_CLASS_FIELD
+    model = settings.LANGUAGE_MODEL_CLASS
+    return _get(name='model', loader=lambda: model.objects.values_list(field, flat=True), cached=cached)
+
+
+def invalidate_languages(application=None):
+    """
+    Invalidate application language codes, every language list is invalidated without application.
+    Other processes keep theirs until LANGUAGE_CACHE_TIMEOUT, catalog builders read languages uncached
+    """
+    cache = _shared_cache()
+
+    if application_id := getattr(application, 'id', application):
+        name = f'application:{application_id}'
+        language_cache.delete(name)
+
+        if cache:
+            cache.delete(_shared_key(cache, name=name))
+        return
+
+    language_cache.clear()
+    if cache:
+        try:
+            cache.incr(GENERATION_KEY)
+        except ValueError:
+            cache.set(GENERATION_KEY, _generation(), timeout=None)
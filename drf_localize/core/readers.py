@@ -0,0 +1,132 @@
+import codecs
+import json
+import re
+import xml.etree.ElementTree as et
+from zipfile import ZipFile
+
+# Import your package here.
+
+from drf_localize.core import (
+    localize_platform,
+    localize_key_type,
+)
+
+# Create your patterns here.
+
+STRINGS_PATTERN = re.compile(
+    r'/\*.*?\*/|//[^\n]*|"((?:[^"\\]|\\.)*)"\s*=\s*"((?:[^"\\]|\\.)*)"\s*;',
+    re.DOTALL
+)
+STRINGS_ESCAPE_PATTERN = re.compile(r'\\(U[0-9a-fA-F]{4}|u[0-9a-fA-F]{4}|.)', re.DOTALL)
+XML_ESCAPE_PATTERN = re.compile(r'\\(u[0-9a-fA-F]{4}|.)', re.DOTALL)
+ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0'}
+
+PLATFORM_FILE_PATTERNS = {
+    platform: re.compile(re.escape(name).replace(re.escape('{language}'), '(?P<language>[^/]+)'))
+    for platform, name in localize_platform.PLATFORM_FILES.items()
+}
+
+
+# Create your helper functions here.
+
+def _unescape(match) -> str:
+    escaped = match.group(1)
+
+    if len(escaped) == 5 and escaped[0] in 'uU':
+        return chr(int(escaped[1:], 16))
+
+    return ESCAPES.get(escaped, escaped)
+
+
+def _decode(content: bytes = b'') -> str:
+    # Xcode saves .strings files as UTF-16 with BOM
+    if content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return content.decode('utf-16')
+
+    return content.decode('utf-8-sig')
+
+
+def read_strings(stream=None):
+    """
+    Read (key, value) pairs of an iOS .strings file, comments are skipped
+    """
+    for match in STRINGS_PATTERN.finditer(_decode(stream.read())):
+        # Comment
+        if match.group(1) is None:
+            continue
+
+        key, value = match.groups()
+        yield STRINGS_ESCAPE_PATTERN.sub(_unescape, key), STRINGS_ESCAPE_PATTERN.sub(_unescape, value)
+
+
+def read_xml(stream=None):
+    """
+    Read (key, value) pairs of an Android strings.xml file, parsed incrementally in constant memory
+    """
+    for _, element in et.iterparse(stream, events=('end',)):
+        if element.tag != 'string':
+            continue
+
+        if name := element.get('name'):
+            value = ''.join(element.itertext())
+
+            # Quoted values keep their whitespace, blank values are exported as a single space
+            if len(value) > 1 and value[0] == value[-1] == '"':
+                value = value[1:-1]
+            elif not value.strip():
+                value = ''
+
+            yield name, XML_ESCAPE_PATTERN.sub(_unescape, value)
+
+        element.clear()
+
+
+def read_json(stream=None):
+    """
+    Read (key, type, value) of a locale JSON file, objects are read as namespaces of string values
+    """
+    source = json.load(stream)
+
+    if not isinstance(source, dict):
+        raise ValueError('Localize JSON object expected')
+
+    for code, value in source.items():
+        if isinstance(value, str):
+            yield code, localize_key_type.KEY_PLAIN, value
+        elif isinstance(value, dict):
+            yield code, localize_key_type.KEY_NAMESPACE, {
+                key: item for key, item in value.items() if isinstance(item, str)
+            }
+
+
+def read_platform(platform: str = '', stream=None):
+    """
+    Read (key, type, value) of a platform file
+    """
+    if platform == localize_platform.PLATFORM_WEB:
+        yield from read_json(stream)
+        return
+
+    reader = read_strings if platform == localize_platform.PLATFORM_IOS else read_xml
+    for code, value in reader(stream):
+        yield code, localize_key_type.KEY_PLAIN, value
+
+
+def read_zip(stream=None):
+    """
+    Read (language, key, type, value) of a zip in `build_zip` layout, nested platform zips included
+    """
+    with ZipFile(stream) as zip_object:
+        for name in zip_object.namelist():
+            if name.endswith('.zip'):
+                with zip_object.open(name) as nested:
+                    yield from read_zip(nested)
+                continue
+
+            for platform in localize_platform.PLATFORM_BUNDLE_ORDER:
+                if not (match := PLATFORM_FILE_PATTERNS[platform].fullmatch(name)):
+                    continue
+
+                with zip_object.open(name) as file:
+                    for code, typing, value in read_platform(platform=platform, stream=file):
+                        yield match.group('language'), code, typing, value
@@ -0,0 +1,91 @@
+import json
+
+# Import your package here.
+
+from drf_localize.settings import settings
+
+# Create your constants here.
+
+# Bumped whenever rendered bytes change for the same keys, so clients & caches don't keep older output
+RENDERER_VERSION = 2
+
+# Create your patterns here.
+
+XML_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '\\': '\\\\',
+    "'": "\\'",
+    '"': '\\"',
+    '\n': '\\n',
+    '\t': '\\t',
+})
+XML_ATTRIBUTE_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+})
+STRINGS_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '"': '\\"',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+
+
+# Create your helper functions here.
+
+def escape_xml(value: str = '') -> str:
+    """
+    Escape Android string resource value, leading @ & ? would be read as references
+    """
+    value = value.translate(XML_ESCAPES)
+
+    if value[:1] in ('@', '?'):
+        return f'\\{value}'
+
+    return value
+
+
+def escape_strings(value: str = '') -> str:
+    return value.translate(STRINGS_ESCAPES)
+
+
+def write_xml(stream=None, mapping: dict = None):
+    """
+    Write Android strings.xml of {key -> value} to a binary stream in a single pass
+    """
+    stream.write(b"<?xml version='1.0' encoding='UTF-8'?>\n<resources>")
+
+    for code, translate in (mapping or {}).items():
+        # Blank values are kept as a single space
+        name, value = code.translate(XML_ATTRIBUTE_ESCAPES), escape_xml(translate) or ' '
+        stream.write(f'\n\t<string name="{name}">{value}</string>'.encode('utf-8'))
+
+    stream.write(b'\n</resources>')
+
+
+def write_strings(stream=None, mapping: dict = None):
+    """
+    Write iOS .strings of {key -> value} to a binary stream in a single pass
+    """
+    separator = ''
+
+    for code, translate in (mapping or {}).items():
+        stream.write(f'{separator}"{escape_strings(code)}" = "{escape_strings(translate)}";'.encode('utf-8'))
+        separator = '\n'
+
+
+def write_json(stream=None, mapping: dict = None):
+    """
+    Write web locale JSON of {key -> value} to a binary stream, compact if JSON_COMPACT is set
+    """
+    if settings.JSON_COMPACT:
+        content = json.dumps(mapping or {}, separators=(',', ':'), sort_keys=True)
+    else:
+        content = json.dumps(mapping or {}, indent=4, sort_keys=True)
+
+    stream.write(content.encode('utf-8'))
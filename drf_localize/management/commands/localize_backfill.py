@@ -0,0 +1,47 @@
+from django.apps import apps
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+
+# Import your package here.
+
+from drf_localize.core import localize
+from drf_localize.catalogs.backfills import get_backfill_models
+
+
+# Create your commands here.
+
+class Command(BaseCommand):
+    help = 'Backfill LOCALIZE_AUTO_UPDATE model translations with the current languages.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', help='Model label to backfill, e.g. blog.Blog, every model by default.')
+        parser.add_argument('--batch-size', type=int, default=None, help='Rows updated at once.')
+        parser.add_argument('--start', default=None, help='Resume after this primary key, requires --model.')
+
+    def handle(self, *args, **options):
+        models = get_backfill_models()
+
+        if label := options['model']:
+            try:
+                models = [apps.get_model(label)]
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+
+        if options['start'] is not None and not label:
+            raise CommandError('--start requires --model.')
+
+        for model in models:
+            label = model._meta.label  # noqa
+
+            def progress(pk, updated):
+                self.stdout.write(f'{label}: {updated} updated, last primary key {pk}')
+
+            updated = localize.backfill(
+                model=model,
+                batch_size=options['batch_size'],
+                start=options['start'],
+                progress=progress,
+            )
+            self.stdout.write(self.style.SUCCESS(f'{label}: backfilled {updated} rows'))
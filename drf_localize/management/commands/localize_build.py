@@ -0,0 +1,48 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from django.db import connections
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+
+# Import your package here.
+
+from drf_localize.models import LocalizeApplication
+from drf_localize.catalogs.builds import build_application
+from drf_localize.catalogs.storages import get_artifact_storage
+
+
+# Create your commands here.
+
+class Command(BaseCommand):
+    help = 'Prebuild every platform file & zip of application catalogs into the artifact storage.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--application', action='append', default=[], help='Application hash, every by default.')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Render processes, 1 to disable.')
+
+    def handle(self, *args, **options):
+        if not get_artifact_storage():
+            raise CommandError('DRF_LOCALIZE ARTIFACT_STORAGE_CLASS setting is not set.')
+
+        applications = LocalizeApplication.objects.all()
+
+        if hashes := options['application']:
+            applications = applications.filter(hash__in=hashes)
+        else:
+            # Whole catalog, used without X-API-Key
+            applications = [None, *applications]
+
+        applications = list(applications)
+        workers = options['workers'] or 1
+
+        # Database connections must not be shared with forked workers
+        connections.close_all()
+
+        with (ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()) as executor:
+            for application in applications:
+                version, artifacts = build_application(application=application, executor=executor)
+                name = getattr(application, 'hash', None) or 'default'
+                self.stdout.write(self.style.SUCCESS(f'{name}: built {len(artifacts)} artifacts, version {version}'))
@@ -0,0 +1,77 @@
+from django.db import (
+    connections,
+    DatabaseError,
+    DEFAULT_DB_ALIAS,
+)
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+
+# Import your package here.
+
+from drf_localize.settings import settings
+
+# Create your constants here.
+
+POSTGRESQL_INDEXES = {
+    # Prefix search & lookups on code within an application
+    'like': ('drf_localize_key_code_like', '(application_id, code varchar_pattern_ops)', None),
+    # Substring search on code, requires pg_trgm extension
+    'trgm': ('drf_localize_key_code_trgm', 'USING gin (code gin_trgm_ops)', 'pg_trgm'),
+    # Language key lookups on translations, e.g. missing translations of a language, slows down every key write
+    'i18n': ('drf_localize_key_i18n_gin', 'USING gin (i18n)', None),
+}
+
+
+# Create your commands here.
+
+class Command(BaseCommand):
+    help = 'Create optional PostgreSQL key search indexes concurrently, without locking key writes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('indexes', nargs='*', help=f'Indexes to create of {", ".join(POSTGRESQL_INDEXES)}, '
+                                                       f'every index by default.')
+        parser.add_argument('--drop', action='store_true', help='Drop indexes instead.')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='Database alias.')
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        labels = options['indexes'] or list(POSTGRESQL_INDEXES)
+
+        if unknown := sorted(set(labels) - set(POSTGRESQL_INDEXES)):
+            raise CommandError(f'Unknown indexes {", ".join(unknown)}.')
+
+        if connection.vendor != 'postgresql':
+            raise CommandError('Optional key indexes require PostgreSQL.')
+
+        if connection.in_atomic_block:
+            raise CommandError('Indexes are built concurrently, which is not possible in a transaction.')
+
+        table = connection.ops.quote_name(settings.KEY_MODEL_CLASS._meta.db_table)  # noqa
+
+        for label in labels:
+            name, definition, extension = POSTGRESQL_INDEXES[label]
+
+            try:
+                with connection.cursor() as cursor:
+                    if options['drop']:
+                        cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+                        self.stdout.write(self.style.SUCCESS(f'{name}: dropped'))
+                        continue
+
+                    if extension:
+                        cursor.execute(f'CREATE EXTENSION IF NOT EXISTS {extension}')
+
+                    # Interrupted concurrent builds leave an invalid index behind, it is rebuilt
+                    cursor.execute(
+                        'SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid '
+                        'WHERE pg_class.relname = %s AND NOT pg_index.indisvalid', [name]
+                    )
+                    if cursor.fetchone():
+                        cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+                    cursor.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}')
+                    self.stdout.write(self.style.SUCCESS(f'{name}: created'))
+            except DatabaseError as e:
+                raise CommandError(f'{name}: {e}')
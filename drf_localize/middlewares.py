@@ -1,13 +1,16 @@
+import asyncio
 from django.utils.deprecation import MiddlewareMixin
 
 # Import your package here.
 
 from drf_localize.settings import settings
-from drf_localize.models import (
-    LocalizeApplication,
+from drf_localize.applications.caches import (
+    get_localize_application,
+    aget_localize_application,
 )
 from drf_localize.applications.helpers import (
     set_current_localize_application,
+    unset_current_localize_application,
 )
 
 
@@ -15,12 +18,33 @@ from drf_localize.applications.helpers import (
 
 
 class LocalizeApplicationMiddleware(MiddlewareMixin):
+    """
+    Sync & async capable middleware, the application is stored in a context variable
+    """
 
     @staticmethod
-    def process_request(request):
+    def set_application(request, application=None):
+        request.application = application
+        return set_current_localize_application(application)
+
+    def __call__(self, request):
+        # Exit out to async mode, if needed
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+
         key = request.META.get(settings.API_KEY_HEADER_NAME)
-        application = LocalizeApplication.objects.prefetch_related('languages').filter(hash=key).first()
+        token = self.set_application(request, get_localize_application(key=key))
 
-        # Setting in thread
-        request.application = application
-        set_current_localize_application(application)
+        try:
+            return self.get_response(request)
+        finally:
+            unset_current_localize_application(token)
+
+    async def __acall__(self, request):
+        key = request.META.get(settings.API_KEY_HEADER_NAME)
+        token = self.set_application(request, await aget_localize_application(key=key))
+
+        try:
+            return await self.get_response(request)
+        finally:
+            unset_current_localize_application(token)
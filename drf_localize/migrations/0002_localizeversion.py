@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-18 02:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drf_localize', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LocalizeVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('modified', models.DateTimeField(auto_now=True)),
+                ('application', models.OneToOneField(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='catalog_version', to='drf_localize.localizeapplication')),
+            ],
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.25 on 2026-10-18 02:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drf_localize', '0002_localizeversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LocalizeKeyChange',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=512)),
+                ('type', models.CharField(choices=[('NAMESPACE', 'NAMESPACE'), ('PLAIN', 'PLAIN')], default='PLAIN', max_length=32)),
+                ('action', models.CharField(choices=[('SAVE', 'SAVE'), ('DELETE', 'DELETE')], default='SAVE', max_length=32)),
+                ('previous', models.JSONField(null=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('catalog_version', models.PositiveBigIntegerField(db_index=True, default=0)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('application', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='drf_localize.localizeapplication')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='localizekeychange',
+            index=models.Index(fields=['application', 'version'], name='drf_localiz_applica_d7e32c_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-18 03:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drf_localize', '0003_localizekeychange'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='localizekey',
+            index=models.Index(fields=['application', 'type', 'code'], name='drf_localiz_applica_41f0f6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='localizekey',
+            index=models.Index(fields=['application', 'id'], name='drf_localiz_applica_598770_idx'),
+        ),
+    ]
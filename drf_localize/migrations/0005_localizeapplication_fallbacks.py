@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 03:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drf_localize', '0004_localizekey_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='localizeapplication',
+            name='fallbacks',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
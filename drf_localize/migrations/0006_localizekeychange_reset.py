@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 03:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drf_localize', '0005_localizeapplication_fallbacks'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='localizekeychange',
+            name='action',
+            field=models.CharField(choices=[('SAVE', 'SAVE'), ('DELETE', 'DELETE'), ('RESET', 'RESET')], default='SAVE', max_length=32),
+        ),
+    ]
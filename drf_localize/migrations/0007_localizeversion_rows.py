@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+def create_versions(apps, schema_editor):
+    """
+    Create whole catalog & application versions missing on upgraded databases, key deletions only bump existing ones
+    """
+    LocalizeVersion = apps.get_model('drf_localize', 'LocalizeVersion')  # noqa
+    LocalizeApplication = apps.get_model('drf_localize', 'LocalizeApplication')  # noqa
+
+    if not LocalizeVersion.objects.filter(application=None).exists():
+        LocalizeVersion.objects.create(application=None)
+
+    LocalizeVersion.objects.bulk_create([
+        LocalizeVersion(application_id=application_id)
+        for application_id in LocalizeApplication.objects.filter(catalog_version=None).values_list('id', flat=True)
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drf_localize', '0006_localizekeychange_reset'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_versions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.25 on 2026-10-18 03:32
+
+from django.db import migrations, models
+
+
+def mark_whole_version(apps, schema_editor):
+    """
+    Keep the latest of duplicated whole catalog rows & mark it unique
+    """
+    LocalizeVersion = apps.get_model('drf_localize', 'LocalizeVersion')  # noqa
+    rows = list(LocalizeVersion.objects.filter(application=None).order_by('-version', 'id').values_list('id', flat=True))
+
+    if rows:
+        LocalizeVersion.objects.filter(id__in=rows[1:]).delete()
+        LocalizeVersion.objects.filter(id=rows[0]).update(whole=True)
+    else:
+        LocalizeVersion.objects.create(whole=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('drf_localize', '0007_localizeversion_rows'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='localizeversion',
+            name='whole',
+            field=models.BooleanField(default=None, editable=False, null=True, unique=True),
+        ),
+        migrations.RunPython(mark_whole_version, migrations.RunPython.noop),
+    ]
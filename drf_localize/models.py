@@ -37,6 +37,11 @@ class LocalizeKey(ApplicationAwareModelMixin):
 
     class Meta:
         unique_together = ('code', 'application_id', 'type',)
+        indexes = [
+            # Application scoped exports, lookups & code search / ordering
+            models.Index(fields=['application', 'type', 'code']),
+            models.Index(fields=['application', 'id']),
+        ]
 
 
 class LocalizeApplication(models.Model):
@@ -46,8 +51,56 @@ class LocalizeApplication(models.Model):
     languages = models.ManyToManyField(settings.LANGUAGE_MODEL_CLASS, default=list,
                                        through='LocalizeApplicationLanguage',
                                        related_name='applications')
+    # Language -> fallback languages, e.g. {"ro": ["en"]}, override FALLBACKS setting
+    fallbacks = models.JSONField(default=dict, blank=True)
 
 
 class LocalizeApplicationLanguage(models.Model):
     application = models.ForeignKey(LocalizeApplication, on_delete=models.CASCADE)
     language = models.ForeignKey(settings.LANGUAGE_MODEL_CLASS, on_delete=models.CASCADE)
+
+
+class LocalizeVersion(models.Model):
+    """
+    Catalog version of an application, application-less row stands for the whole catalog
+    """
+    application = models.OneToOneField(LocalizeApplication, on_delete=models.CASCADE, null=True,
+                                       related_name='catalog_version')
+    # Set on the whole catalog row only, NULL applications are not unique
+    whole = models.BooleanField(null=True, unique=True, default=None, editable=False)
+    version = models.PositiveBigIntegerField(default=0)
+    modified = models.DateTimeField(auto_now=True)
+
+
+class LocalizeKeyChange(models.Model):
+    """
+    Key change log, used to serve translations changed since a catalog version
+    """
+    ACTION_SAVE = 'SAVE'
+    ACTION_DELETE = 'DELETE'
+    # Catalog changed without key changes, e.g. languages or fallbacks, clients reload the whole catalog
+    ACTION_RESET = 'RESET'
+
+    ACTION_CHOICES = (
+        (ACTION_SAVE, ACTION_SAVE),
+        (ACTION_DELETE, ACTION_DELETE),
+        (ACTION_RESET, ACTION_RESET)
+    )
+
+    application = models.ForeignKey(LocalizeApplication, on_delete=models.CASCADE, null=True)
+    code = models.CharField(max_length=512)
+    type = models.CharField(max_length=32, choices=LocalizeKeyType.KEY_CHOICES, default=LocalizeKeyType.KEY_PLAIN)
+    action = models.CharField(max_length=32, choices=ACTION_CHOICES, default=ACTION_SAVE)
+
+    # Key translations before the change
+    previous = models.JSONField(null=True)
+
+    # Application & whole catalog versions after the change
+    version = models.PositiveBigIntegerField(default=0)
+    catalog_version = models.PositiveBigIntegerField(default=0, db_index=True)
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['application', 'version']),
+        ]
@@ -1,3 +1,4 @@
+from zipfile import ZIP_DEFLATED
 from django.conf import settings as django_settings
 from django.test.signals import setting_changed
 from django.utils.translation import gettext_lazy as _
@@ -20,13 +21,38 @@ DEFAULTS = {
     'KEY_MODEL_CLASS': 'drf_localize.models.LocalizeKey',
     'LANGUAGE_MODEL_CLASS': 'drf_localize.models.LocalizeLanguage',
     'LANGUAGE_MODEL_CLASS_FIELD': 'code',
+    'ARTIFACT_CACHE_SIZE': 128,
+    'KEY_CHUNK_SIZE': 2000,
+    'LANGUAGE_CACHE_SIZE': 1024,
+    'LANGUAGE_CACHE_TIMEOUT': 60,
+    'LANGUAGE_CACHE_ALIAS': None,
+    'APPLICATION_CACHE_SIZE': 1024,
+    'APPLICATION_CACHE_TIMEOUT': 60,
+    'APPLICATION_CACHE_ALIAS': None,
+    'BACKFILL_BATCH_SIZE': 1000,
+    'ARTIFACT_STORAGE_CLASS': None,
+    'ARTIFACT_STORAGE_PATH': 'drf_localize',
+    'ARTIFACT_ENCODINGS': ['br', 'gzip'],
+    'JSON_COMPACT': False,
+    'ZIP_COMPRESSION': ZIP_DEFLATED,
+    'ZIP_COMPRESSION_LEVEL': None,
+    'CATALOG_MAX_AGE': 0,
+    'IMPORT_BATCH_SIZE': 1000,
+    'FALLBACKS': {},
+    'CATALOG_CACHE_SIZE': 128,
+    'CATALOG_CACHE_ALIAS': None,
+    'CATALOG_CACHE_TIMEOUT': 86400,
+    'CATALOG_LOCK_TIMEOUT': 30,
+    'STALE_WHILE_REVALIDATE': True,
+    'LOOKUP_CHECK_INTERVAL': 5,
 }
 
 IMPORT_STRINGS = (
     'MIDDLEWARE_CLASS',
     'PAGINATION_CLASS',
     'KEY_MODEL_CLASS',
-    'LANGUAGE_MODEL_CLASS'
+    'LANGUAGE_MODEL_CLASS',
+    'ARTIFACT_STORAGE_CLASS',
 )
 
 REMOVED_SETTINGS = (